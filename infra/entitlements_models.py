@@ -101,7 +101,7 @@ class EntitlementsCache(Base):
     customer_id: str = Column(String(64), unique=True, nullable=False)
     data: Dict[str, object] = Column(JSON, nullable=False)
     refreshed_at: datetime = Column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow, index=True
     )
 
 
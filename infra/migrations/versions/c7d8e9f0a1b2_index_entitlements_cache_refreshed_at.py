@@ -0,0 +1,51 @@
+"""index entitlements cache refresh timestamps
+
+Revision ID: c7d8e9f0a1b2
+Revises: a2cba7eee9aa
+Create Date: 2026-10-17 13:40:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c7d8e9f0a1b2"
+down_revision = "a2cba7eee9aa"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_entitlements_cache_refreshed_at"
+
+
+def _existing_indexes() -> set[str] | None:
+    inspector = sa.inspect(op.get_bind())
+    if "entitlements_cache" not in inspector.get_table_names():
+        return None
+    return {index["name"] for index in inspector.get_indexes("entitlements_cache")}
+
+
+def upgrade() -> None:
+    # The entitlements tables are created by the services themselves; only index
+    # deployments where the table already exists.
+    indexes = _existing_indexes()
+    if indexes is None or INDEX_NAME in indexes:
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "entitlements_cache",
+                ["refreshed_at"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(INDEX_NAME, "entitlements_cache", ["refreshed_at"])
+
+
+def downgrade() -> None:
+    indexes = _existing_indexes()
+    if indexes is None or INDEX_NAME not in indexes:
+        return
+    op.drop_index(INDEX_NAME, table_name="entitlements_cache")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -29,9 +29,10 @@ class Settings(BaseSettings):
     class Config:
         env_prefix = "CODEX_GATEWAY_"
         case_sensitive = False
+        frozen = True
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Return cached settings to avoid re-parsing environment variables."""
 
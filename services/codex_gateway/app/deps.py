@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from fastapi import Depends
-
 from libs.codex import MemoryEventBroker
 
-from .config import Settings, get_settings
+from .config import get_settings
 
 
-async def get_broker(settings: Settings = Depends(get_settings)) -> MemoryEventBroker:
+async def get_broker() -> MemoryEventBroker:
     """Return the in-memory broker used to push events to the worker."""
 
+    settings = get_settings()
     if settings.broker_backend != "memory":  # pragma: no cover - placeholder for future backends
         msg = f"Unsupported broker backend: {settings.broker_backend}"
         raise RuntimeError(msg)
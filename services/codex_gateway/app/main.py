@@ -2,30 +2,52 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
-
-from fastapi import Depends, FastAPI, Request, status
+import orjson
+from fastapi import Depends, FastAPI, Request, Response, status
 
 from libs.codex import CodexEvent, CodexEventPayload
 from libs.observability.logging import RequestContextMiddleware, configure_logging
 from libs.observability.metrics import setup_metrics
 
-from .config import Settings, get_settings
+from .config import get_settings
 from .deps import get_broker
 from .security import verify_github_signature, verify_stripe_signature, verify_tradingview_signature
 
 configure_logging("codex-gateway")
+SETTINGS = get_settings()
 
 app = FastAPI(title="Codex Gateway", version="0.1.0")
 app.add_middleware(RequestContextMiddleware, service_name="codex-gateway")
 setup_metrics(app, service_name="codex-gateway")
 
+# Webhook acknowledgements are constant: serialise them once instead of per request.
+_QUEUED_BODY = b'{"status":"queued"}'
+_OK_BODY = b'{"status":"ok"}'
+
+
+def _queued_response() -> Response:
+    return Response(
+        content=_QUEUED_BODY,
+        status_code=status.HTTP_202_ACCEPTED,
+        media_type="application/json",
+    )
+
+
+def _index_headers(request: Request) -> dict[str, str]:
+    """Index request headers in one pass; ASGI servers already lower-case header names."""
+
+    headers: dict[str, str] = {}
+    for key, value in request.headers.raw:
+        headers.setdefault(key.decode("latin-1"), value.decode("latin-1"))
+    return headers
+
 
 def _extract_event_type(body: bytes) -> str | None:
     try:
-        payload = json.loads(body.decode("utf-8"))
-    except (UnicodeDecodeError, json.JSONDecodeError):
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
         return None
     event_type = payload.get("type")
     if isinstance(event_type, str):
@@ -36,79 +58,79 @@ def _extract_event_type(body: bytes) -> str | None:
 @app.post("/webhooks/github", status_code=status.HTTP_202_ACCEPTED)
 async def github_webhook(
     request: Request,
-    settings: Settings = Depends(get_settings),
     broker=Depends(get_broker),
-) -> dict[str, Any]:
+) -> Response:
     body = await request.body()
-    signature = request.headers.get("X-Hub-Signature-256")
-    verify_github_signature(settings.github_webhook_secret, signature, body)
+    headers = _index_headers(request)
+    signature = headers.get("x-hub-signature-256")
+    verify_github_signature(SETTINGS.github_webhook_secret, signature, body)
 
     event = CodexEvent(
         provider="github",
-        eventType=request.headers.get("X-GitHub-Event"),
-        delivery=request.headers.get("X-GitHub-Delivery"),
+        eventType=headers.get("x-github-event"),
+        delivery=headers.get("x-github-delivery"),
         signature=signature,
         payload=CodexEventPayload(
-            contentType=request.headers.get("Content-Type", "application/json"),
+            contentType=headers.get("content-type", "application/json"),
             body=body,
         ),
         metadata={
-            "user_agent": request.headers.get("User-Agent", ""),
-            "hook_id": request.headers.get("X-GitHub-Hook-ID", ""),
+            "user_agent": headers.get("user-agent", ""),
+            "hook_id": headers.get("x-github-hook-id", ""),
         },
     )
     await broker.publish(event)
-    return {"status": "queued"}
+    return _queued_response()
 
 
 @app.post("/webhooks/stripe", status_code=status.HTTP_202_ACCEPTED)
 async def stripe_webhook(
     request: Request,
-    settings: Settings = Depends(get_settings),
     broker=Depends(get_broker),
-) -> dict[str, Any]:
+) -> Response:
     body = await request.body()
-    signature = request.headers.get("stripe-signature")
-    verify_stripe_signature(settings.stripe_webhook_secret, signature, body)
+    headers = _index_headers(request)
+    signature = headers.get("stripe-signature")
+    verify_stripe_signature(SETTINGS.stripe_webhook_secret, signature, body)
 
     event = CodexEvent(
         provider="stripe",
         eventType=_extract_event_type(body),
         signature=signature,
         payload=CodexEventPayload(
-            contentType=request.headers.get("Content-Type", "application/json"),
+            contentType=headers.get("content-type", "application/json"),
             body=body,
         ),
-        metadata={"stripe_event_id": request.headers.get("Stripe-Signature-Id", "")},
+        metadata={"stripe_event_id": headers.get("stripe-signature-id", "")},
     )
     await broker.publish(event)
-    return {"status": "queued"}
+    return _queued_response()
 
 
 @app.post("/webhooks/tradingview", status_code=status.HTTP_202_ACCEPTED)
 async def tradingview_webhook(
     request: Request,
-    settings: Settings = Depends(get_settings),
     broker=Depends(get_broker),
-) -> dict[str, Any]:
+) -> Response:
     body = await request.body()
-    signature = request.headers.get("X-Signature")
-    verify_tradingview_signature(settings.tradingview_webhook_secret, signature, body)
+    headers = _index_headers(request)
+    signature = headers.get("x-signature")
+    verify_tradingview_signature(SETTINGS.tradingview_webhook_secret, signature, body)
 
     event = CodexEvent(
         provider="tradingview",
         eventType=_extract_event_type(body),
         signature=signature,
         payload=CodexEventPayload(
-            contentType=request.headers.get("Content-Type", "application/json"),
+            contentType=headers.get("content-type", "application/json"),
             body=body,
         ),
-        metadata={"user_agent": request.headers.get("User-Agent", "")},
+        metadata={"user_agent": headers.get("user-agent", "")},
     )
     await broker.publish(event)
-    return {"status": "queued"}
+    return _queued_response()
 
 
 @app.get("/health", status_code=status.HTTP_200_OK)
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(content=_OK_BODY, media_type="application/json")
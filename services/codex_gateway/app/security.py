@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import base64
 import hmac
-from hashlib import sha256
-from time import time
+import re
+from time import time_ns
 
 from fastapi import HTTPException, status
 
+_STRIPE_TOLERANCE_SECONDS = 300
+# ``Stripe-Signature`` looks like ``t=<unix ts>,v1=<hex>[,v1=<hex>][,v0=<hex>]``; several
+# ``v1`` entries are sent while a signing secret is being rolled.
+_STRIPE_TIMESTAMP_RE = re.compile(r"(?:^|,)t=(\d+)(?=,|$)")
+_STRIPE_V1_RE = re.compile(r"(?:^|,)v1=([0-9a-f]+)(?=,|$)")
+
 
 def verify_github_signature(secret: str, signature_header: str | None, body: bytes) -> None:
     """Validate a GitHub webhook signature."""
@@ -17,8 +23,13 @@ def verify_github_signature(secret: str, signature_header: str | None, body: byt
         return
     if not signature_header or not signature_header.startswith("sha256="):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
-    signature = signature_header.split("=", 1)[1]
-    expected = hmac.new(secret.encode("utf-8"), body, sha256).hexdigest()
+    try:
+        signature = bytes.fromhex(signature_header.removeprefix("sha256="))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature"
+        ) from exc
+    expected = hmac.digest(secret.encode("utf-8"), body, "sha256")
     if not hmac.compare_digest(expected, signature):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature")
 
@@ -31,27 +42,19 @@ def verify_stripe_signature(secret: str, signature_header: str | None, body: byt
     if not signature_header:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
 
-    elements: dict[str, str] = {}
-    for part in signature_header.split(","):
-        try:
-            key, value = part.split("=", 1)
-        except ValueError as exc:  # pragma: no cover - defensive
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature header"
-            ) from exc
-        elements[key] = value
-
-    timestamp = int(elements.get("t", "0"))
-    transmitted_signature = elements.get("v1")
-    if not transmitted_signature:
+    timestamp_match = _STRIPE_TIMESTAMP_RE.search(signature_header)
+    timestamp = int(timestamp_match.group(1)) if timestamp_match else 0
+    transmitted_signatures = _STRIPE_V1_RE.findall(signature_header)
+    if not transmitted_signatures:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
 
-    if abs(int(time()) - timestamp) > 300:
+    now = time_ns() // 1_000_000_000
+    if not now - _STRIPE_TOLERANCE_SECONDS <= timestamp <= now + _STRIPE_TOLERANCE_SECONDS:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expired signature")
 
-    signed_payload = f"{timestamp}.{body.decode('utf-8')}".encode("utf-8")
-    expected = hmac.new(secret.encode("utf-8"), msg=signed_payload, digestmod=sha256).hexdigest()
-    if not hmac.compare_digest(expected, transmitted_signature):
+    signed_payload = b"%d.%b" % (timestamp, body)
+    expected = hmac.digest(secret.encode("utf-8"), signed_payload, "sha256").hex()
+    if not any(hmac.compare_digest(expected, value) for value in transmitted_signatures):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature")
 
 
@@ -63,7 +66,7 @@ def verify_tradingview_signature(secret: str, signature_header: str | None, body
     if not signature_header:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
 
-    digest = hmac.new(secret.encode("utf-8"), body, sha256).digest()
+    digest = hmac.digest(secret.encode("utf-8"), body, "sha256")
     expected = base64.b64encode(digest).decode("utf-8")
     if not hmac.compare_digest(expected, signature_header):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature")
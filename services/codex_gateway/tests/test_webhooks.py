@@ -12,8 +12,8 @@ from fastapi import status
 from httpx import ASGITransport, AsyncClient
 
 from libs.codex import MemoryEventBroker
-from services.codex_gateway.app import deps
-from services.codex_gateway.app.config import Settings, get_settings
+from services.codex_gateway.app import deps, main
+from services.codex_gateway.app.config import Settings
 from services.codex_gateway.app.main import app
 
 
@@ -24,19 +24,20 @@ def reset_dependencies() -> None:
 
 
 @pytest.fixture()
-def configured_settings() -> Settings:
-    return Settings(
+def configured_settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
+    settings = Settings(
         github_webhook_secret="gh-secret",
         stripe_webhook_secret="stripe-secret",
         tradingview_webhook_secret="tv-secret",
     )
+    monkeypatch.setattr(main, "SETTINGS", settings)
+    return settings
 
 
 @pytest.mark.asyncio
 async def test_github_webhook_enqueues_event(configured_settings: Settings) -> None:
     broker = MemoryEventBroker()
     app.dependency_overrides[deps.get_broker] = lambda: broker
-    app.dependency_overrides[get_settings] = lambda: configured_settings
 
     body = b'{"action": "created"}'
     signature = hmac.new(b"gh-secret", body, sha256).hexdigest()
@@ -62,8 +63,6 @@ async def test_github_webhook_enqueues_event(configured_settings: Settings) -> N
 
 @pytest.mark.asyncio
 async def test_github_webhook_rejects_invalid_signature(configured_settings: Settings) -> None:
-    app.dependency_overrides[get_settings] = lambda: configured_settings
-
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         response = await client.post(
             "/webhooks/github",
@@ -78,7 +77,6 @@ async def test_github_webhook_rejects_invalid_signature(configured_settings: Set
 async def test_stripe_webhook_verifies_signature(configured_settings: Settings) -> None:
     broker = MemoryEventBroker()
     app.dependency_overrides[deps.get_broker] = lambda: broker
-    app.dependency_overrides[get_settings] = lambda: configured_settings
 
     body = b'{"type": "checkout.session.completed"}'
     timestamp = int(time())
@@ -103,7 +101,6 @@ async def test_stripe_webhook_verifies_signature(configured_settings: Settings)
 async def test_tradingview_webhook_verifies_signature(configured_settings: Settings) -> None:
     broker = MemoryEventBroker()
     app.dependency_overrides[deps.get_broker] = lambda: broker
-    app.dependency_overrides[get_settings] = lambda: configured_settings
 
     body = b'{"type": "alert"}'
     digest = hmac.new(b"tv-secret", body, sha256).digest()
@@ -120,3 +117,57 @@ async def test_tradingview_webhook_verifies_signature(configured_settings: Setti
     event = await broker.get()
     assert event.provider == "tradingview"
     assert event.event_type == "alert"
+
+
+@pytest.mark.asyncio
+async def test_stripe_webhook_rejects_expired_timestamp(configured_settings: Settings) -> None:
+    body = b'{"type": "checkout.session.completed"}'
+    timestamp = int(time()) - 301
+    signed_payload = f"{timestamp}.{body.decode('utf-8')}".encode("utf-8")
+    signature = hmac.new(b"stripe-secret", msg=signed_payload, digestmod=sha256).hexdigest()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/webhooks/stripe",
+            content=body,
+            headers={"stripe-signature": f"t={timestamp},v1={signature}"},
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Expired signature"
+
+
+@pytest.mark.asyncio
+async def test_health_and_queued_responses_are_json() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        health = await client.get("/health")
+        queued = await client.post("/webhooks/tradingview", content=b'{"type": "alert"}')
+
+    assert health.status_code == status.HTTP_200_OK
+    assert health.json() == {"status": "ok"}
+    assert queued.status_code == status.HTTP_202_ACCEPTED
+    assert queued.headers["content-type"] == "application/json"
+    assert queued.json() == {"status": "queued"}
+
+
+@pytest.mark.asyncio
+async def test_stripe_webhook_accepts_any_v1_signature(configured_settings: Settings) -> None:
+    broker = MemoryEventBroker()
+    app.dependency_overrides[deps.get_broker] = lambda: broker
+
+    body = b'{"type": "invoice.paid"}'
+    timestamp = int(time())
+    signed_payload = f"{timestamp}.{body.decode('utf-8')}".encode("utf-8")
+    signature = hmac.new(b"stripe-secret", msg=signed_payload, digestmod=sha256).hexdigest()
+    header = f"t={timestamp},v1={'0' * 64},v1={signature},v0=legacy"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/webhooks/stripe",
+            content=body,
+            headers={"stripe-signature": header},
+        )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    event = await broker.get()
+    assert event.event_type == "invoice.paid"
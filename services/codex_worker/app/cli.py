@@ -22,16 +22,18 @@ async def run_once(event: CodexEvent) -> None:
     sandbox = SandboxRunner(settings.sandbox_image, settings.checkout_root)
     entitlements = EntitlementChecker(settings.feature_flag_environment)
     worker = CodexWorker(broker, github, sandbox, entitlements)
-    await worker._handle_event(event)
-    await github.close()
+    try:
+        await worker._handle_event(event)
+    finally:
+        await sandbox.close()
+        await github.close()
 
 
 def load_event(provider: str, event_type: str, path: Path) -> CodexEvent:
-    payload = path.read_text(encoding="utf-8")
     return CodexEvent(
         provider=provider,
         eventType=event_type,
-        payload=CodexEventPayload(contentType="application/json", body=payload.encode("utf-8")),
+        payload=CodexEventPayload(contentType="application/json", body=path.read_bytes()),
     )
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -28,8 +28,9 @@ class Settings(BaseSettings):
     class Config:
         env_prefix = "CODEX_WORKER_"
         case_sensitive = False
+        frozen = True
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     return Settings()
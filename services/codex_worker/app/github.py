@@ -5,6 +5,9 @@ from __future__ import annotations
 from typing import Any
 
 import httpx
+import orjson
+
+_JSON_HEADERS = httpx.Headers({"Content-Type": "application/json"})
 
 
 class GitHubClient:
@@ -33,31 +36,30 @@ class GitHubClient:
             await self._client.aclose()
 
     async def create_check_run(self, repository: str, payload: dict[str, Any]) -> dict[str, Any]:
-        response = await self._client.post(f"/repos/{repository}/check-runs", json=payload)
-        response.raise_for_status()
-        return response.json()
+        return await self._send("POST", f"/repos/{repository}/check-runs", payload)
 
     async def update_check_run(
         self, repository: str, check_run_id: int, payload: dict[str, Any]
     ) -> dict[str, Any]:
-        response = await self._client.patch(
-            f"/repos/{repository}/check-runs/{check_run_id}", json=payload
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._send("PATCH", f"/repos/{repository}/check-runs/{check_run_id}", payload)
 
     async def post_pr_comment(self, repository: str, pull_number: int, body: str) -> dict[str, Any]:
-        response = await self._client.post(
-            f"/repos/{repository}/issues/{pull_number}/comments", json={"body": body}
+        return await self._send(
+            "POST", f"/repos/{repository}/issues/{pull_number}/comments", {"body": body}
         )
-        response.raise_for_status()
-        return response.json()
 
     async def merge_pull_request(
         self, repository: str, pull_number: int, payload: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        response = await self._client.put(
-            f"/repos/{repository}/pulls/{pull_number}/merge", json=payload or {}
+        return await self._send(
+            "PUT", f"/repos/{repository}/pulls/{pull_number}/merge", payload or {}
+        )
+
+    async def _send(self, method: str, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send ``payload`` pre-encoded with orjson instead of httpx's stdlib ``json=``."""
+
+        response = await self._client.request(
+            method, url, content=orjson.dumps(payload), headers=_JSON_HEADERS
         )
         response.raise_for_status()
         return response.json()
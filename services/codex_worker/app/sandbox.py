@@ -3,10 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import os
+import tempfile
+import uuid
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
 
+# Only the head and tail of the container output are kept in memory: chatty test runs can
+# emit tens of megabytes of logs while the worker only ever reports the first and last lines.
+_HEAD_LINES = 4000
+_TAIL_LINES = 4000
+_TRUNCATION_MARKER = b"... truncated ...\n"
+_READ_CHUNK_BYTES = 64 * 1024
+# Longer lines (``\r`` progress bars, minified dumps...) are split at this size so a
+# single unterminated line cannot grow without bound.
+_MAX_LINE_BYTES = 1 << 20
+_SCRIPT_HEADER = "#!/usr/bin/env bash\nset -euo pipefail\n"
+
 
 @dataclass(slots=True)
 class SandboxResult:
@@ -17,38 +33,216 @@ class SandboxResult:
     exit_code: int
 
 
+@dataclass(slots=True)
+class _Container:
+    """Container running sandbox commands, possibly kept warm for later runs."""
+
+    container_id: str
+    repository: str
+    uses: int = 0
+
+
 class SandboxRunner:
-    """Execute commands inside an ephemeral container."""
+    """Execute commands inside isolated containers.
+
+    By default every run starts a fresh ``docker run --rm`` container, which is the
+    cheapest option for one-shot callers such as the CLI. Long-lived workers can pass
+    ``pool_size`` to keep up to that many containers warm (``sleep infinity`` plus
+    ``docker exec``); a warm container only serves runs for the repository it was
+    started for and is recycled after ``max_uses`` runs.
+    """
 
-    def __init__(self, image: str, checkout_root: str) -> None:
+    def __init__(
+        self,
+        image: str,
+        checkout_root: str,
+        *,
+        pool_size: int = 0,
+        max_uses: int = 20,
+    ) -> None:
         self._image = image
         self._checkout_root = Path(checkout_root)
         self._checkout_root.mkdir(parents=True, exist_ok=True)
+        self._pool_size = pool_size
+        self._max_uses = max_uses
+        self._idle: deque[_Container] = deque()
+        self._mount = f"{self._checkout_root}:/workspace"
 
     async def run(self, repository: str, commands: Sequence[str]) -> SandboxResult:
         """Execute the provided commands in an isolated container."""
 
-        joined_commands = " && ".join(commands)
-        docker_cmd = [
+        if self._pool_size:
+            container = await self._acquire(repository)
+            if isinstance(container, SandboxResult):
+                return container
+        else:
+            container = _Container(f"codex-run-{uuid.uuid4().hex}", repository)
+
+        returncode: int | None = None
+        process: asyncio.subprocess.Process | None = None
+        script_path: Path | None = None
+        try:
+            # Commands are written to a script inside the mounted checkout rather than
+            # joined into a single ``bash -c`` argument that bash would have to re-tokenise.
+            script_path = self._write_script(commands)
+            process = await asyncio.create_subprocess_exec(
+                *self._command(container, f"/workspace/{script_path.name}"),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            output = await _collect_output(process.stdout) if process.stdout else ""
+            returncode = await process.wait()
+        finally:
+            if script_path is not None:
+                script_path.unlink(missing_ok=True)
+            if returncode is None:
+                # The run was interrupted: stop the docker client and drop the container,
+                # whose state is unknown, instead of leaking it.
+                if process is not None and process.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                    await process.wait()
+                await self._remove(container)
+
+        if self._pool_size:
+            # Exit codes >= 125 may come from docker itself (daemon error, dead container)
+            # or from the script; only the container state tells them apart.
+            healthy = returncode < 125 or await self._is_running(container)
+            await self._release(container, healthy=healthy)
+        return SandboxResult(success=returncode == 0, logs=output, exit_code=returncode)
+
+    def _command(self, container: _Container, script: str) -> tuple[str, ...]:
+        environment = ("-e", f"CODEX_REPOSITORY={container.repository}")
+        if not self._pool_size:
+            return (
+                "docker",
+                "run",
+                "--rm",
+                "--name",
+                container.container_id,
+                "-v",
+                self._mount,
+                *environment,
+                self._image,
+                "bash",
+                "-l",
+                script,
+            )
+        return ("docker", "exec", *environment, container.container_id, "bash", "-l", script)
+
+    def _write_script(self, commands: Sequence[str]) -> Path:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=self._checkout_root,
+            prefix=".codex-run-",
+            suffix=".sh",
+            delete=False,
+            encoding="utf-8",
+        ) as script:
+            script.write(_SCRIPT_HEADER)
+            script.write("\n".join(commands))
+            script.write("\n")
+        os.chmod(script.name, 0o755)
+        return Path(script.name)
+
+    async def close(self) -> None:
+        """Stop every idle container held by the pool."""
+
+        while self._idle:
+            await self._remove(self._idle.popleft())
+
+    async def _acquire(self, repository: str) -> _Container | SandboxResult:
+        for container in self._idle:
+            if container.repository == repository:
+                self._idle.remove(container)
+                return container
+
+        process = await asyncio.create_subprocess_exec(
             "docker",
             "run",
+            "-d",
             "--rm",
             "-v",
-            f"{self._checkout_root}:/workspace",
-            "-e",
-            f"CODEX_REPOSITORY={repository}",
+            self._mount,
             self._image,
-            "bash",
-            "-lc",
-            joined_commands,
-        ]
-        process = await asyncio.create_subprocess_exec(
-            *docker_cmd,
+            "sleep",
+            "infinity",
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
         )
         stdout, _ = await process.communicate()
         output = stdout.decode("utf-8", errors="ignore")
-        return SandboxResult(
-            success=process.returncode == 0, logs=output, exit_code=process.returncode
+        if process.returncode != 0:
+            return SandboxResult(success=False, logs=output, exit_code=process.returncode or 1)
+        return _Container(container_id=output.strip(), repository=repository)
+
+    async def _release(self, container: _Container, *, healthy: bool) -> None:
+        container.uses += 1
+        if not healthy or container.uses >= self._max_uses:
+            await self._remove(container)
+            return
+        if len(self._idle) >= self._pool_size:
+            await self._remove(self._idle.popleft())
+        self._idle.append(container)
+
+    @staticmethod
+    async def _is_running(container: _Container) -> bool:
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "inspect",
+            "-f",
+            "{{.State.Running}}",
+            container.container_id,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode == 0 and stdout.strip() == b"true"
+
+    @staticmethod
+    async def _remove(container: _Container) -> None:
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "rm",
+            "-f",
+            container.container_id,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
+        await process.wait()
+
+
+async def _collect_output(stream: asyncio.StreamReader) -> str:
+    """Read ``stream`` in fixed-size chunks, keeping only its head and tail lines in memory."""
+
+    head: list[bytes] = []
+    tail: deque[bytes] = deque(maxlen=_TAIL_LINES)
+    truncated = False
+
+    def keep(line: bytes) -> None:
+        nonlocal truncated
+        if len(head) < _HEAD_LINES:
+            head.append(line)
+            return
+        if len(tail) == _TAIL_LINES:
+            truncated = True
+        tail.append(line)
+
+    pending = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        pending += chunk
+        start = 0
+        while (end := pending.find(b"\n", start)) != -1:
+            keep(bytes(pending[start : end + 1]))
+            start = end + 1
+        del pending[:start]
+        while len(pending) >= _MAX_LINE_BYTES:
+            keep(bytes(pending[:_MAX_LINE_BYTES]))
+            del pending[:_MAX_LINE_BYTES]
+    if pending:
+        keep(bytes(pending))
+
+    if truncated:
+        head.append(_TRUNCATION_MARKER)
+    head.extend(tail)
+    return b"".join(head).decode("utf-8", errors="ignore")
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sys
+from pathlib import Path
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 from openfeature import api
 from openfeature.provider.in_memory_provider import InMemoryFlag, InMemoryProvider
 
 from libs.codex import CodexEvent, CodexEventPayload
+from services.codex_worker.app.cli import load_event
 from services.codex_worker.app.entitlements import EntitlementChecker
-from services.codex_worker.app.sandbox import SandboxResult
+from services.codex_worker.app.github import GitHubClient
+from services.codex_worker.app.sandbox import SandboxResult, SandboxRunner
 from services.codex_worker.app.worker import CodexWorker
 
 
@@ -92,3 +98,169 @@ async def test_worker_denies_command_without_entitlement() -> None:
     github.post_pr_comment.assert_awaited_once()
     sandbox.run.assert_not_called()
     github.create_check_run.assert_not_called()
+
+
+def _fake_docker(monkeypatch: pytest.MonkeyPatch, exec_script: str) -> list[tuple[str, ...]]:
+    original_exec = asyncio.create_subprocess_exec
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_exec(*args: str, **kwargs: object) -> asyncio.subprocess.Process:
+        calls.append(args)
+        scripts = {
+            "run": "print('container-1')" if "-d" in args else exec_script,
+            "exec": exec_script,
+            "inspect": "print('true')",
+            "rm": "pass",
+        }
+        return await original_exec(sys.executable, "-c", scripts[args[1]], **kwargs)
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_sandbox_keeps_head_and_tail_of_long_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_docker(monkeypatch, "for i in range(10000): print(f'line {i}')")
+    runner = SandboxRunner("image", str(tmp_path))
+
+    result = await runner.run("octo/repo", ["pytest"])
+
+    lines = result.logs.splitlines()
+    assert result.success and result.exit_code == 0
+    assert lines[0] == "line 0"
+    assert lines[3999] == "line 3999"
+    assert lines[4000] == "... truncated ..."
+    assert lines[4001] == "line 6000"
+    assert lines[-1] == "line 9999"
+
+
+@pytest.mark.asyncio
+async def test_sandbox_reuses_warm_container(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _fake_docker(monkeypatch, "print('ok')")
+    runner = SandboxRunner("image", str(tmp_path), pool_size=1, max_uses=2)
+
+    await runner.run("octo/repo", ["pytest"])
+    await runner.run("octo/repo", ["pytest"])
+    await runner.close()
+
+    assert [call[1] for call in calls] == ["run", "exec", "exec", "rm"]
+    assert all("container-1" in call for call in calls[1:])
+    assert calls[1][-1].startswith("/workspace/.codex-run-")
+    assert not list(tmp_path.glob(".codex-run-*"))
+
+
+@pytest.mark.asyncio
+async def test_sandbox_splits_unterminated_long_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_docker(monkeypatch, "import sys; sys.stdout.write('x' * (3 << 20) + '\\rdone')")
+    runner = SandboxRunner("image", str(tmp_path))
+
+    result = await runner.run("octo/repo", ["pytest"])
+
+    assert result.success
+    assert result.logs == "x" * (3 << 20) + "\rdone"
+
+
+@pytest.mark.asyncio
+async def test_sandbox_removes_container_when_run_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _fake_docker(monkeypatch, "import time; time.sleep(30)")
+
+    async def broken_collect(stream: asyncio.StreamReader) -> str:
+        raise RuntimeError("read failed")
+
+    monkeypatch.setattr("services.codex_worker.app.sandbox._collect_output", broken_collect)
+    pooled = SandboxRunner("image", str(tmp_path), pool_size=1)
+    one_shot = SandboxRunner("image", str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        await pooled.run("octo/repo", ["pytest"])
+    with pytest.raises(RuntimeError):
+        await one_shot.run("octo/repo", ["pytest"])
+
+    assert [call[1] for call in calls] == ["run", "exec", "rm", "run", "rm"]
+    assert calls[2][-1] == "container-1"
+    assert calls[4][-1] == calls[3][calls[3].index("--name") + 1]
+    assert not pooled._idle
+    assert not list(tmp_path.glob(".codex-run-*"))
+
+
+@pytest.mark.asyncio
+async def test_sandbox_runs_one_shot_container_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _fake_docker(monkeypatch, "print('ok')")
+    runner = SandboxRunner("image", str(tmp_path))
+
+    result = await runner.run("octo/repo", ["pytest"])
+    await runner.close()
+
+    assert result.logs == "ok\n"
+    assert len(calls) == 1
+    assert calls[0][:3] == ("docker", "run", "--rm")
+    assert "CODEX_REPOSITORY=octo/repo" in calls[0]
+    assert calls[0][-1].startswith("/workspace/.codex-run-")
+
+
+@pytest.mark.asyncio
+async def test_sandbox_keeps_warm_container_after_script_exit_127(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _fake_docker(monkeypatch, "import sys; sys.exit(127)")
+    runner = SandboxRunner("image", str(tmp_path), pool_size=2)
+
+    first = await runner.run("octo/repo", ["missing-command"])
+    await runner.run("octo/repo", ["missing-command"])
+    await runner.run("octo/other", ["missing-command"])
+
+    assert first.exit_code == 127 and not first.success
+    assert [call[1] for call in calls] == [
+        "run",
+        "exec",
+        "inspect",
+        "exec",
+        "inspect",
+        "run",
+        "exec",
+        "inspect",
+    ]
+    assert [container.repository for container in runner._idle] == ["octo/repo", "octo/other"]
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_github_client_sends_pre_encoded_json() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"id": 1})
+
+    client = httpx.AsyncClient(
+        base_url="https://api.github.com", transport=httpx.MockTransport(handler)
+    )
+    github = GitHubClient("token", client=client)
+
+    result = await github.post_pr_comment("octo/repo", 7, "hello")
+    await client.aclose()
+
+    assert result == {"id": 1}
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == {"body": "hello"}
+
+
+def test_load_event_keeps_raw_payload_bytes(tmp_path: Path) -> None:
+    raw = '{"action": "créé"}'.encode("utf-8")
+    path = tmp_path / "event.json"
+    path.write_bytes(raw)
+
+    event = load_event("github", "issue_comment", path)
+
+    assert event.payload.body == raw
+    assert event.body_as_json() == {"action": "créé"}
@@ -1,30 +1,41 @@
-from fastapi import FastAPI, HTTPException
-
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 
 from .persistence import persist_config
 from .schemas import ConfigUpdate
-from .settings import Settings, load_settings
+from .settings import Settings, load_settings, reload_settings
 from libs.entitlements import install_entitlements_middleware
 from libs.observability.logging import RequestContextMiddleware, configure_logging
 from libs.observability.metrics import setup_metrics
 
 configure_logging("config-service")
 
-app = FastAPI(title="Config Service", version="1.0.0")
+app = FastAPI(title="Config Service", version="1.0.0", default_response_class=ORJSONResponse)
 install_entitlements_middleware(app, required_capabilities=["can.use_config"], required_quotas={})
 app.add_middleware(RequestContextMiddleware, service_name="config-service")
 setup_metrics(app, service_name="config-service")
 
+_HEALTH_BODY = b'{"status":"ok"}'
+
+# Serialised body of the settings object currently returned by ``load_settings``. It is
+# rebuilt whenever ``reload_settings`` swaps that object (e.g. after ``/config/update``).
+_current_config_cache: tuple[Settings, bytes] | None = None
+
 
 @app.get("/health", tags=["Monitoring"])
-def health() -> dict:
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/config/current", response_model=Settings, tags=["Configuration"])
-def get_current_config():
-    return load_settings()
+async def get_current_config() -> Response:
+    global _current_config_cache
+
+    settings = load_settings()
+    if _current_config_cache is None or _current_config_cache[0] is not settings:
+        _current_config_cache = (settings, orjson.dumps(settings.model_dump(mode="json")))
+    return Response(content=_current_config_cache[1], media_type="application/json")
 
 
 @app.post("/config/update", response_model=Settings, tags=["Configuration"])
@@ -39,4 +50,5 @@ def update_config(payload: ConfigUpdate):
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     persist_config(new_settings)
+    reload_settings()
     return new_settings
@@ -1,6 +1,10 @@
-import json
 import os
-from typing import Any, Dict
+import uuid
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+import orjson
 
 DATA_DIR = os.environ.get("CONFIG_DATA_DIR", "/data")
 CONFIG_FILES: Dict[str, str] = {
@@ -10,13 +14,42 @@ CONFIG_FILES: Dict[str, str] = {
     "native": os.path.join(DATA_DIR, "config.native.json"),
 }
 
+# Parsed file contents keyed by path, validated against ``(st_mtime_ns, st_size)`` so
+# files created or rewritten by another process are picked up. Set
+# ``CONFIG_CACHE_DISABLE=1`` to always re-read the file.
+_content_cache: Dict[str, tuple[int, int, Dict[str, Any]]] = {}
+# Directories already created by ``persist_config``.
+_ensured_dirs: set[str] = set()
+
+
+def invalidate_config_cache(env: str | None = None) -> None:
+    if env is None:
+        _content_cache.clear()
+        return
+    path = CONFIG_FILES.get(env)
+    if path:
+        _content_cache.pop(path, None)
+
 
-def read_config_for_env(env: str) -> Dict[str, Any] | None:
+def read_config_for_env(env: str) -> Mapping[str, Any] | None:
     path = CONFIG_FILES.get(env)
-    if not path or not os.path.exists(path):
+    if not path:
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    try:
+        if os.environ.get("CONFIG_CACHE_DISABLE") == "1":
+            return MappingProxyType(orjson.loads(Path(path).read_bytes()))
+        stat = os.stat(path)
+        cached = _content_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return MappingProxyType(cached[2])
+        data = orjson.loads(Path(path).read_bytes())
+    except (FileNotFoundError, IsADirectoryError):
+        _content_cache.pop(path, None)
+        return None
+    _content_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    # Read-only view: callers merge it into their own dict, so the cached data is never
+    # copied nor exposed to mutation.
+    return MappingProxyType(data)
 
 
 def persist_config(settings) -> None:
@@ -25,6 +58,20 @@ def persist_config(settings) -> None:
     if not path:
         raise ValueError(f"Environnement inconnu : {env}")
 
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(settings.model_dump_json(indent=2))
+    directory = os.path.dirname(path)
+    if directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+    payload = orjson.dumps(settings.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+
+    # Write to a sibling file then rename: readers never observe a truncated config.
+    # The name is unique per call, since concurrent updates run in the threadpool.
+    tmp_path = f"{path}.tmp.{uuid.uuid4().hex}"
+    try:
+        Path(tmp_path).write_bytes(payload)
+    except FileNotFoundError:
+        # The directory vanished since it was first created; recreate it once.
+        os.makedirs(directory, exist_ok=True)
+        Path(tmp_path).write_bytes(payload)
+    os.replace(tmp_path, path)
+    invalidate_config_cache(env)
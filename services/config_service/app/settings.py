@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Literal
 
+from dotenv import dotenv_values
 from pydantic import AnyUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,35 +35,91 @@ def _default_postgres_dsn() -> str:
     return DEFAULT_POSTGRES_DSN_NATIVE
 
 
+# Environment-derived defaults are resolved once per process rather than on every
+# ``Settings`` construction; ``refresh_defaults`` re-reads them.
+_DEFAULTS: dict[str, str] = {}
+
+
+def refresh_defaults() -> None:
+    _DEFAULTS.update(
+        ENVIRONMENT=get_environment(),
+        POSTGRES_DSN=_default_postgres_dsn(),
+        REDIS_URL=get_redis_url(),
+        RABBITMQ_URL=get_rabbitmq_url(),
+    )
+
+
+refresh_defaults()
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env.dev", env_prefix="", case_sensitive=False, extra="allow"
     )
 
     APP_NAME: str = "trading-bot-config"
-    ENVIRONMENT: str = Field(default_factory=get_environment, pattern="^(dev|test|prod|native)$")
-    POSTGRES_DSN: str = Field(default_factory=_default_postgres_dsn)
-    REDIS_URL: AnyUrl | str = Field(default_factory=get_redis_url)
-    RABBITMQ_URL: AnyUrl | str = Field(default_factory=get_rabbitmq_url)
+    ENVIRONMENT: Literal["dev", "test", "prod", "native"] = Field(
+        default_factory=lambda: _DEFAULTS["ENVIRONMENT"]
+    )
+    POSTGRES_DSN: str = Field(default_factory=lambda: _DEFAULTS["POSTGRES_DSN"])
+    REDIS_URL: AnyUrl | str = Field(default_factory=lambda: _DEFAULTS["REDIS_URL"])
+    RABBITMQ_URL: AnyUrl | str = Field(default_factory=lambda: _DEFAULTS["RABBITMQ_URL"])
 
 
-def load_settings() -> Settings:
-    env_name = get_environment()
-    env_file = ENV_FILE_MAP.get(env_name)
-    settings_kwargs = {}
-    if env_file and Path(env_file).exists():
-        settings_kwargs["_env_file"] = env_file
-
-    env_settings = Settings(**settings_kwargs)
-    file_data = read_config_for_env(env_settings.ENVIRONMENT)
-
-    merged_data = {
-        **env_settings.model_dump(),
-        **(file_data or {}),
+_FIELD_NAMES = {name.lower(): name for name in Settings.model_fields}
+
+
+@lru_cache(maxsize=8)
+def _env_file_values(env_file: str, mtime_ns: int) -> dict[str, str]:
+    """Parse ``env_file`` once per modification time (``mtime_ns`` is the cache key)."""
+
+    return {
+        _FIELD_NAMES.get(key.lower(), key): value
+        for key, value in dotenv_values(env_file).items()
+        if value is not None
     }
-    merged_data.setdefault("ENVIRONMENT", env_settings.ENVIRONMENT)
-    merged_data.setdefault("POSTGRES_DSN", _default_postgres_dsn())
-    merged_data.setdefault("REDIS_URL", get_redis_url())
-    merged_data.setdefault("RABBITMQ_URL", get_rabbitmq_url())
 
-    return Settings(**merged_data)
+
+def _raw_settings_sources(env_file: str | None) -> dict[str, Any]:
+    """Collect env-file then environment values, keyed by field name where one matches.
+
+    This mirrors the pydantic-settings precedence (environment over ``.env``) so the
+    merged data can be validated by a single ``Settings`` construction.
+    """
+
+    raw: dict[str, Any] = {}
+    if env_file:
+        try:
+            mtime_ns = os.stat(env_file).st_mtime_ns
+        except FileNotFoundError:
+            pass
+        else:
+            raw.update(_env_file_values(env_file, mtime_ns))
+    for key, value in os.environ.items():
+        field_name = _FIELD_NAMES.get(key.lower())
+        if field_name:
+            raw[field_name] = value
+    return raw
+
+
+@lru_cache(maxsize=1)
+def load_settings() -> Settings:
+    env_file = ENV_FILE_MAP.get(get_environment())
+    if not env_file or not Path(env_file).exists():
+        env_file = Settings.model_config.get("env_file")
+
+    raw = _raw_settings_sources(env_file)
+    environment = str(raw.get("ENVIRONMENT") or get_environment()).strip().lower()
+    file_data = read_config_for_env(environment)
+    if file_data:
+        raw.update(file_data)
+
+    return Settings(_env_file=None, **raw)
+
+
+def reload_settings() -> Settings:
+    """Drop the cached settings so the next call re-reads env and config files."""
+
+    refresh_defaults()
+    load_settings.cache_clear()
+    return load_settings()
@@ -1,16 +1,13 @@
 from __future__ import annotations
 
-import importlib
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
 _service_root = Path(__file__).resolve().parents[1]
 _package_name = "config_service_app"
-_repo_root = _service_root.parents[1]
-
-if str(_repo_root) not in sys.path:
-    sys.path.append(str(_repo_root))
 
 if _package_name not in sys.modules:
     _package_spec = importlib.util.spec_from_file_location(
@@ -23,14 +20,45 @@ if _package_name not in sys.modules:
     sys.modules[_package_name] = _package_module
     _package_spec.loader.exec_module(_package_module)  # type: ignore[arg-type]
 
-main = importlib.import_module(f"{_package_name}.main")
-persistence = importlib.import_module(f"{_package_name}.persistence")
-schemas = importlib.import_module(f"{_package_name}.schemas")
-settings_module = importlib.import_module(f"{_package_name}.settings")
-
-app = main.app  # type: ignore[attr-defined]
-ConfigUpdate = schemas.ConfigUpdate
-Settings = settings_module.Settings
-load_settings = settings_module.load_settings
-read_config_for_env = persistence.read_config_for_env
-CONFIG_FILES = persistence.CONFIG_FILES
+
+def _lazyload(name: str) -> ModuleType:
+    """Register ``name`` so that it only executes on first attribute access."""
+
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    assert spec and spec.loader
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Building the FastAPI app pulls in the whole observability/entitlements stack, so the
+# submodules are only materialised when a test touches one of the names below.
+main = _lazyload(f"{_package_name}.main")
+persistence = _lazyload(f"{_package_name}.persistence")
+schemas = _lazyload(f"{_package_name}.schemas")
+settings_module = _lazyload(f"{_package_name}.settings")
+
+_EXPORTS: dict[str, tuple[ModuleType, str]] = {
+    "app": (main, "app"),
+    "ConfigUpdate": (schemas, "ConfigUpdate"),
+    "Settings": (settings_module, "Settings"),
+    "load_settings": (settings_module, "load_settings"),
+    "reload_settings": (settings_module, "reload_settings"),
+    "read_config_for_env": (persistence, "read_config_for_env"),
+    "invalidate_config_cache": (persistence, "invalidate_config_cache"),
+    "persist_config": (persistence, "persist_config"),
+    "CONFIG_FILES": (persistence, "CONFIG_FILES"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(module, attribute)
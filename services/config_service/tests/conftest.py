@@ -6,18 +6,24 @@ from pathlib import Path
 from types import ModuleType
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = str(CURRENT_DIR.parents[2])
 
+# The service package imports ``services``/``libs`` from the repository root; conftest is
+# imported once per session, so this is the only place the path needs checking.
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+# Test modules import from ``HELPERS_NAME`` once this conftest has registered it, so the
+# service package is bootstrapped a single time per session.
 HELPERS_NAME = "config_service_test_helpers"
 HELPERS_PATH = CURRENT_DIR / "_helpers.py"
 
 
 def _load_helpers(name: str, path: Path) -> ModuleType:
-    if name in sys.modules:
-        return sys.modules[name]
-
     spec = importlib.util.spec_from_file_location(name, path)
     assert spec and spec.loader
     module = importlib.util.module_from_spec(spec)
@@ -28,34 +34,49 @@ def _load_helpers(name: str, path: Path) -> ModuleType:
 
 helpers = _load_helpers(HELPERS_NAME, HELPERS_PATH)
 
-CONFIG_FILES = helpers.CONFIG_FILES
-app = helpers.app
 
+@pytest.fixture(scope="session", name="app")
+def app_fixture() -> FastAPI:
+    return helpers.app
 
-@pytest.fixture()
-def client() -> Generator[TestClient, None, None]:
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Generator[TestClient, None, None]:
     with TestClient(app) as test_client:
         yield test_client
 
 
+@pytest.fixture(scope="session")
+def config_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("config")
+
+
 @pytest.fixture()
-def config_env(tmp_path) -> Generator[str, None, None]:
+def config_env(config_data_dir: Path) -> Generator[str, None, None]:
     original_env = os.environ.get("ENVIRONMENT")
     original_dir = os.environ.get("CONFIG_DATA_DIR")
-    original_mapping = dict(CONFIG_FILES)
+    config_files = helpers.CONFIG_FILES
+    original_mapping = dict(config_files)
 
     os.environ["ENVIRONMENT"] = "test"
-    os.environ["CONFIG_DATA_DIR"] = str(tmp_path)
+    os.environ["CONFIG_DATA_DIR"] = str(config_data_dir)
 
-    CONFIG_FILES.clear()
+    config_files.clear()
     for env in ("dev", "test", "prod"):
-        CONFIG_FILES[env] = os.path.join(str(tmp_path), f"config.{env}.json")
+        config_files[env] = str(config_data_dir / f"config.{env}.json")
 
+    helpers.invalidate_config_cache()
+    helpers.load_settings.cache_clear()
     try:
-        yield str(tmp_path)
+        yield str(config_data_dir)
     finally:
-        CONFIG_FILES.clear()
-        CONFIG_FILES.update(original_mapping)
+        # The directory is shared by the whole session: drop what this test wrote.
+        for config_path in config_data_dir.iterdir():
+            config_path.unlink()
+        helpers.invalidate_config_cache()
+        helpers.load_settings.cache_clear()
+        config_files.clear()
+        config_files.update(original_mapping)
 
         if original_env is None:
             os.environ.pop("ENVIRONMENT", None)
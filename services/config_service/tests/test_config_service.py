@@ -1,37 +1,20 @@
-import importlib.util
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from types import ModuleType
+from types import MappingProxyType
 
 import pytest
+from config_service_test_helpers import (
+    CONFIG_FILES,
+    ConfigUpdate,
+    Settings,
+    invalidate_config_cache,
+    load_settings,
+    persist_config,
+    read_config_for_env,
+    reload_settings,
+)
 from pydantic import ValidationError
 
-CURRENT_DIR = Path(__file__).resolve().parent
-
-HELPERS_NAME = "config_service_test_helpers"
-HELPERS_PATH = CURRENT_DIR / "_helpers.py"
-
-
-def _load_helpers(name: str, path: Path) -> ModuleType:
-    if name in sys.modules:
-        return sys.modules[name]
-
-    spec = importlib.util.spec_from_file_location(name, path)
-    assert spec and spec.loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[name] = module
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-    return module
-
-
-helpers = _load_helpers(HELPERS_NAME, HELPERS_PATH)
-
-CONFIG_FILES = helpers.CONFIG_FILES
-ConfigUpdate = helpers.ConfigUpdate
-Settings = helpers.Settings
-load_settings = helpers.load_settings
-read_config_for_env = helpers.read_config_for_env
-
 
 def test_health_check(client):
     response = client.get("/health")
@@ -59,10 +42,34 @@ def test_update_config(client, config_env):
 
     assert config_path.exists()
     assert "My-Awesome-Trading-Bot" in config_path.read_text(encoding="utf-8")
+    assert [p.name for p in Path(config_env).iterdir()] == ["config.test.json"]
+
+    current = client.get("/config/current")
+    assert current.json()["APP_NAME"] == "My-Awesome-Trading-Bot"
 
     CONFIG_FILES.pop("test", None)
 
 
+def test_persist_config_handles_concurrent_writers(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.test.json"
+    monkeypatch.setitem(CONFIG_FILES, "test", str(config_path))
+    names = [f"Bot-{index}" for index in range(16)]
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda name: persist_config(Settings(APP_NAME=name, ENVIRONMENT="test")),
+                    names,
+                )
+            )
+
+        assert read_config_for_env("test")["APP_NAME"] in names
+        assert [path.name for path in tmp_path.iterdir()] == ["config.test.json"]
+    finally:
+        invalidate_config_cache("test")
+
+
 def test_read_config_for_env_reads_json(tmp_path):
     config_path = tmp_path / "config.custom.json"
     config_path.write_text("{\"APP_NAME\": \"Custom-Bot\"}", encoding="utf-8")
@@ -74,6 +81,55 @@ def test_read_config_for_env_reads_json(tmp_path):
         data = read_config_for_env("custom")
         assert data == {"APP_NAME": "Custom-Bot"}
     finally:
+        invalidate_config_cache("custom")
+        CONFIG_FILES.clear()
+        CONFIG_FILES.update(original_config_files)
+
+
+def test_read_config_for_env_picks_up_files_created_later(tmp_path):
+    config_path = tmp_path / "config.custom.json"
+    original_config_files = dict(CONFIG_FILES)
+    CONFIG_FILES["custom"] = str(config_path)
+
+    try:
+        assert read_config_for_env("custom") is None
+        config_path.write_text("{\"APP_NAME\": \"Late-Bot\"}", encoding="utf-8")
+        assert read_config_for_env("custom") == {"APP_NAME": "Late-Bot"}
+
+        config_path.unlink()
+        assert read_config_for_env("custom") is None
+    finally:
+        invalidate_config_cache("custom")
+        CONFIG_FILES.clear()
+        CONFIG_FILES.update(original_config_files)
+
+
+def test_read_config_for_env_returns_read_only_mapping_without_cache(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.custom.json"
+    config_path.write_text("{\"APP_NAME\": \"Uncached\"}", encoding="utf-8")
+    monkeypatch.setitem(CONFIG_FILES, "custom", str(config_path))
+    monkeypatch.setenv("CONFIG_CACHE_DISABLE", "1")
+
+    data = read_config_for_env("custom")
+
+    assert data == {"APP_NAME": "Uncached"}
+    assert isinstance(data, MappingProxyType)
+
+
+def test_read_config_for_env_reloads_modified_file(tmp_path):
+    config_path = tmp_path / "config.custom.json"
+    config_path.write_text("{\"APP_NAME\": \"First\"}", encoding="utf-8")
+    original_config_files = dict(CONFIG_FILES)
+    CONFIG_FILES["custom"] = str(config_path)
+
+    try:
+        assert read_config_for_env("custom") == {"APP_NAME": "First"}
+        assert read_config_for_env("custom") == {"APP_NAME": "First"}
+
+        config_path.write_text("{\"APP_NAME\": \"Second-Name\"}", encoding="utf-8")
+        assert read_config_for_env("custom") == {"APP_NAME": "Second-Name"}
+    finally:
+        invalidate_config_cache("custom")
         CONFIG_FILES.clear()
         CONFIG_FILES.update(original_config_files)
 
@@ -97,10 +153,33 @@ def test_load_settings_merges_environment_file(monkeypatch, tmp_path):
     CONFIG_FILES["test"] = str(config_path)
 
     try:
-        merged = load_settings()
+        merged = reload_settings()
         assert merged.APP_NAME == "Merged"
         assert merged.ENVIRONMENT == "test"
     finally:
         CONFIG_FILES.pop("test", None)
         monkeypatch.delenv("ENVIRONMENT", raising=False)
         monkeypatch.delenv("CONFIG_DATA_DIR", raising=False)
+        load_settings.cache_clear()
+
+
+def test_load_settings_layers_env_file_environment_and_config_file(monkeypatch, tmp_path):
+    (tmp_path / ".env.test").write_text(
+        "APP_NAME=From-Dotenv\nredis_url=redis://dotenv:6379/0\n", encoding="utf-8"
+    )
+    config_path = tmp_path / "config.test.json"
+    config_path.write_text("{\"RABBITMQ_URL\": \"amqp://file:5672//\"}", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ENVIRONMENT", "test")
+    monkeypatch.setenv("REDIS_URL", "redis://environ:6379/0")
+    monkeypatch.setitem(CONFIG_FILES, "test", str(config_path))
+
+    try:
+        merged = reload_settings()
+        assert merged.APP_NAME == "From-Dotenv"
+        assert str(merged.REDIS_URL) == "redis://environ:6379/0"
+        assert str(merged.RABBITMQ_URL) == "amqp://file:5672//"
+    finally:
+        invalidate_config_cache("test")
+        load_settings.cache_clear()
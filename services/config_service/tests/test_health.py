@@ -1,8 +1,4 @@
-﻿from fastapi.testclient import TestClient
-from app.main import app
-
-def test_health():
-    with TestClient(app) as client:
-        r = client.get("/health")
-        assert r.status_code == 200
-        assert r.json()["status"] == "ok"
\ No newline at end of file
+def test_health(client):
+    r = client.get("/health")
+    assert r.status_code == 200
+    assert r.json()["status"] == "ok"
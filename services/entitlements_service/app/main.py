@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from infra import EntitlementsBase
@@ -8,21 +9,27 @@ from libs.db.db import engine, get_db
 from libs.observability.logging import RequestContextMiddleware, configure_logging
 from libs.observability.metrics import setup_metrics
 
-from .resolver import resolve_entitlements
-from .schemas import ResolveResponse
+from .resolver import resolve_entitlements, resolve_entitlements_batch
+from .schemas import BatchResolveRequest, BatchResolveResponse, ResolveResponse
 
 configure_logging("entitlements-service")
 
-app = FastAPI(title="Entitlements Service", version="0.1.0")
+app = FastAPI(
+    title="Entitlements Service",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(RequestContextMiddleware, service_name="entitlements-service")
 setup_metrics(app, service_name="entitlements-service")
 
 EntitlementsBase.metadata.create_all(bind=engine)
 
+_HEALTH_BODY = b'{"status":"ok"}'
+
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/entitlements/resolve", response_model=ResolveResponse)
@@ -31,3 +38,11 @@ def resolve(customer_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="customer_id is required")
     payload = resolve_entitlements(db, customer_id)
     return ResolveResponse(**payload)
+
+
+@app.post("/entitlements/resolve:batch", response_model=BatchResolveResponse)
+def resolve_batch(request: BatchResolveRequest, db: Session = Depends(get_db)):
+    if not all(request.customer_ids):
+        raise HTTPException(status_code=400, detail="customer_ids must not be empty")
+    payloads = resolve_entitlements_batch(db, request.customer_ids)
+    return BatchResolveResponse(entitlements=[ResolveResponse(**payload) for payload in payloads])
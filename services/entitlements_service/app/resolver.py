@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
 
-from infra import EntitlementsCache, Feature, Plan, Subscription
+from infra import EntitlementsCache, Feature, Plan, PlanFeature, Subscription
 
 CACHE_TTL = timedelta(minutes=5)
 
 
+def _utcnow() -> datetime:
+    # ``refreshed_at`` is stored as naive UTC.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def _build_cache_payload(plan: Plan) -> Dict[str, Dict[str, Optional[int]]]:
     capabilities: Dict[str, bool] = {}
     quotas: Dict[str, Optional[int]] = {}
@@ -24,32 +30,108 @@ def _build_cache_payload(plan: Plan) -> Dict[str, Dict[str, Optional[int]]]:
 
 
 def resolve_entitlements(db: Session, customer_id: str) -> Dict[str, object]:
-    cache = db.scalar(select(EntitlementsCache).where(EntitlementsCache.customer_id == customer_id))
-    if cache and cache.refreshed_at >= datetime.utcnow() - CACHE_TTL:
-        return {"customer_id": customer_id, **cache.data, "cached_at": cache.refreshed_at}
+    return resolve_entitlements_batch(db, [customer_id])[0]
+
+
+def resolve_entitlements_batch(db: Session, customer_ids: List[str]) -> List[Dict[str, object]]:
+    """Resolve several customers with at most three statements, in input order."""
+
+    resolved = _resolve_from_database(db, list(dict.fromkeys(customer_ids)))
+    return [dict(resolved[customer_id]) for customer_id in customer_ids]
+
+
+def _resolve_from_database(db: Session, customer_ids: List[str]) -> Dict[str, Dict[str, object]]:
+    resolved: Dict[str, Dict[str, object]] = {}
+    # Freshness is part of the query: stale rows are never loaded, and the refresh
+    # below overwrites them through the upsert.
+    fresh_rows = db.scalars(
+        select(EntitlementsCache).where(
+            EntitlementsCache.customer_id.in_(customer_ids),
+            EntitlementsCache.refreshed_at >= _utcnow() - CACHE_TTL,
+        )
+    )
+    for cache in fresh_rows:
+        resolved[cache.customer_id] = {
+            "customer_id": cache.customer_id,
+            **cache.data,
+            "cached_at": cache.refreshed_at,
+        }
+
+    stale = [customer_id for customer_id in customer_ids if customer_id not in resolved]
+    if not stale:
+        return resolved
 
-    subscription = db.scalar(
+    subscriptions = db.scalars(
         select(Subscription)
         .join(Plan, Plan.id == Subscription.plan_id)
-        .where(Subscription.customer_id == customer_id, Subscription.status == "active")
+        .options(
+            selectinload(Subscription.plan)
+            .selectinload(Plan.features)
+            .joinedload(PlanFeature.feature)
+        )
+        .where(Subscription.customer_id.in_(stale), Subscription.status == "active")
+    )
+    plans = {subscription.customer_id: subscription.plan for subscription in subscriptions}
+
+    now = _utcnow()
+    payloads: Dict[str, Dict[str, Dict[str, Optional[int]]]] = {}
+    for customer_id in stale:
+        plan = plans.get(customer_id)
+        if plan is None:
+            payloads[customer_id] = {"capabilities": {}, "quotas": {}}
+            cached_at = None
+        else:
+            payloads[customer_id] = _build_cache_payload(plan)
+            cached_at = now
+        resolved[customer_id] = {
+            "customer_id": customer_id,
+            **payloads[customer_id],
+            "cached_at": cached_at,
+        }
+    _store_cache(db, payloads, now)
+    return resolved
+
+
+def _store_cache(
+    db: Session,
+    payloads: Dict[str, Dict[str, Dict[str, Optional[int]]]],
+    now: datetime,
+) -> None:
+    """Upsert the cache rows in a single statement instead of SELECT then INSERT/UPDATE."""
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        insert = postgresql.insert
+    elif dialect == "sqlite":
+        insert = sqlite.insert
+    else:  # pragma: no cover - other backends keep the ORM read-modify-write path
+        rows = {
+            cache.customer_id: cache
+            for cache in db.scalars(
+                select(EntitlementsCache).where(EntitlementsCache.customer_id.in_(payloads))
+            )
+        }
+        for customer_id, payload in payloads.items():
+            cache = rows.get(customer_id)
+            if cache:
+                cache.data = payload
+                cache.refreshed_at = now
+            else:
+                db.add(EntitlementsCache(customer_id=customer_id, data=payload, refreshed_at=now))
+        db.commit()
+        return
+
+    statement = insert(EntitlementsCache).values(
+        [
+            {"customer_id": customer_id, "data": payload, "refreshed_at": now}
+            for customer_id, payload in payloads.items()
+        ]
+    )
+    excluded = statement.excluded
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[EntitlementsCache.customer_id],
+            set_={"data": excluded.data, "refreshed_at": excluded.refreshed_at},
+        )
     )
-    if not subscription or not subscription.plan:
-        payload = {"capabilities": {}, "quotas": {}}
-        _store_cache(db, customer_id, payload)
-        return {"customer_id": customer_id, **payload, "cached_at": None}
-
-    payload = _build_cache_payload(subscription.plan)
-    _store_cache(db, customer_id, payload)
-    return {"customer_id": customer_id, **payload, "cached_at": datetime.utcnow()}
-
-
-def _store_cache(db: Session, customer_id: str, payload: Dict[str, Dict[str, Optional[int]]]) -> None:
-    cache = db.scalar(select(EntitlementsCache).where(EntitlementsCache.customer_id == customer_id))
-    now = datetime.utcnow()
-    if cache:
-        cache.data = payload
-        cache.refreshed_at = now
-    else:
-        cache = EntitlementsCache(customer_id=customer_id, data=payload, refreshed_at=now)
-        db.add(cache)
     db.commit()
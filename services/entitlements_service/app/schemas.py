@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 500
 
 
 class ResolveResponse(BaseModel):
@@ -11,3 +13,11 @@ class ResolveResponse(BaseModel):
     capabilities: Dict[str, bool]
     quotas: Dict[str, Optional[int]]
     cached_at: Optional[datetime] = None
+
+
+class BatchResolveRequest(BaseModel):
+    customer_ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchResolveResponse(BaseModel):
+    entitlements: List[ResolveResponse]
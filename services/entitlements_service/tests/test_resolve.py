@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import datetime, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,11 +9,12 @@ import importlib.util
 import sys
 from pathlib import Path
 import types
+from sqlalchemy import delete, event, select
 from sqlalchemy.orm import Session
 
 os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 
-from infra import EntitlementsBase, Feature, Plan, PlanFeature, Subscription
+from infra import EntitlementsBase, EntitlementsCache, Feature, Plan, PlanFeature, Subscription
 from libs.db import db as db_module
 
 MODULE_DIR = Path(__file__).resolve().parents[1]
@@ -32,6 +34,7 @@ module = importlib.util.module_from_spec(spec)
 sys.modules[spec.name] = module
 spec.loader.exec_module(module)
 app = module.app
+resolver = sys.modules[f"{PACKAGE_ROOT}.app.resolver"]
 
 
 @pytest.fixture(autouse=True)
@@ -83,3 +86,80 @@ def test_resolve_empty_when_missing_subscription():
     payload = response.json()
     assert payload["capabilities"] == {}
     assert payload["quotas"] == {}
+
+
+def test_resolve_loads_plan_features_without_lazy_queries(session: Session):
+    seed_plan(session)
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_module.engine, "before_cursor_execute", _record)
+    try:
+        with db_module.SessionLocal() as fresh_session:
+            payload = resolver.resolve_entitlements(fresh_session, "cus_321")
+    finally:
+        event.remove(db_module.engine, "before_cursor_execute", _record)
+
+    assert payload["quotas"]["quota.active_algos"] == 10
+    selects = [stmt for stmt in statements if stmt.lstrip().upper().startswith("SELECT")]
+    assert len([stmt for stmt in selects if "features" in stmt]) == 1
+
+
+def test_resolve_refreshes_stale_cache_row(session: Session):
+    seed_plan(session)
+    session.add(
+        EntitlementsCache(
+            customer_id="cus_321",
+            data={"capabilities": {}, "quotas": {}},
+            refreshed_at=datetime.utcnow() - timedelta(hours=1),
+        )
+    )
+    session.commit()
+
+    payload = resolver.resolve_entitlements(session, "cus_321")
+
+    assert payload["capabilities"] == {"can.use_ibkr": True}
+    rows = session.scalars(select(EntitlementsCache)).all()
+    assert len(rows) == 1
+    session.refresh(rows[0])
+    assert rows[0].data["quotas"] == {"quota.active_algos": 10}
+
+
+def test_resolve_serves_fresh_cache_row(session: Session):
+    seed_plan(session)
+    first = resolver.resolve_entitlements(session, "cus_321")
+
+    session.execute(delete(PlanFeature))
+    session.commit()
+
+    payload = resolver.resolve_entitlements(session, "cus_321")
+    assert payload["capabilities"] == first["capabilities"]
+    assert payload["cached_at"] is not None
+
+
+def test_resolve_batch_returns_input_order_with_bulk_statements(session: Session):
+    seed_plan(session)
+    client = TestClient(app)
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_module.engine, "before_cursor_execute", _record)
+    try:
+        response = client.post(
+            "/entitlements/resolve:batch",
+            json={"customer_ids": ["unknown", "cus_321", "unknown"]},
+        )
+    finally:
+        event.remove(db_module.engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    entitlements = response.json()["entitlements"]
+    assert [item["customer_id"] for item in entitlements] == ["unknown", "cus_321", "unknown"]
+    assert entitlements[0]["capabilities"] == {}
+    assert entitlements[1]["quotas"] == {"quota.active_algos": 10}
+    assert sum(1 for statement in statements if "entitlements_cache" in statement) == 2
+    assert len(session.scalars(select(EntitlementsCache)).all()) == 2
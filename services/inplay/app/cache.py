@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence
+
+import orjson
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+JsonObject = dict[str, Any]
+Fetcher = Callable[[str, float], Awaitable[JsonObject | None]]
+
+
+class DownstreamUnavailable(Exception):
+    """Raised when a downstream service cannot be reached or answers with an error."""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRequest:
+    url: str
+    timeout: float
+    ttl: float
+
+
+class DownstreamCache:
+    """Redis cache for downstream JSON lookups, serving stale entries during outages."""
+
+    def __init__(self, client: Any, stale_ttl: float, prefix: str = "inplay:http:") -> None:
+        self._client = client
+        self._stale_ttl = stale_ttl
+        self._prefix = prefix
+
+    def key_for(self, url: str) -> str:
+        return self._prefix + hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    async def fetch_many(
+        self, requests: Sequence[CachedRequest], fetch: Fetcher
+    ) -> list[JsonObject | None]:
+        keys = [self.key_for(request.url) for request in requests]
+        entries = await self._read(keys)
+        now = time.time()
+
+        results: list[JsonObject | None] = [None] * len(requests)
+        pending: list[int] = []
+        for index, entry in enumerate(entries):
+            if entry is not None and entry["expires_at"] > now:
+                results[index] = entry["payload"]
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+
+        outcomes = await asyncio.gather(
+            *(fetch(requests[index].url, requests[index].timeout) for index in pending),
+            return_exceptions=True,
+        )
+        writes: dict[str, tuple[bytes, int]] = {}
+        for index, outcome in zip(pending, outcomes):
+            if isinstance(outcome, DownstreamUnavailable):
+                stale = entries[index]
+                results[index] = stale["payload"] if stale is not None else None
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results[index] = outcome
+            if outcome is not None:
+                ttl = requests[index].ttl
+                entry = {"payload": outcome, "generated_at": now, "expires_at": now + ttl}
+                writes[keys[index]] = (orjson.dumps(entry), math.ceil(ttl + self._stale_ttl))
+        await self._write(writes)
+        return results
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def _read(self, keys: list[str]) -> list[JsonObject | None]:
+        try:
+            raw_entries = await self._client.mget(keys)
+        except RedisError as exc:
+            logger.warning("Cache Redis indisponible, appel direct des services: %s", exc)
+            return [None] * len(keys)
+        entries: list[JsonObject | None] = []
+        for raw in raw_entries:
+            try:
+                entries.append(orjson.loads(raw) if raw is not None else None)
+            except orjson.JSONDecodeError:
+                entries.append(None)
+        return entries
+
+    async def _write(self, writes: dict[str, tuple[bytes, int]]) -> None:
+        if not writes:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, (value, expiry) in writes.items():
+                    pipe.set(key, value, ex=expiry)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Impossible d'écrire dans le cache Redis: %s", exc)
@@ -28,6 +28,16 @@ class Settings(BaseSettings):
         },
         alias="INPLAY_WATCHLISTS",
     )
+    redis_max_connections: int = Field(
+        20,
+        alias="INPLAY_REDIS_MAX_CONNECTIONS",
+        description="Nombre maximal de connexions Redis partagées par le flux de ticks et le cache",
+    )
+    redis_pool_timeout_seconds: float = Field(
+        1.0,
+        alias="INPLAY_REDIS_POOL_TIMEOUT_SECONDS",
+        description="Attente maximale d'une connexion Redis libre avant de contourner le cache",
+    )
     reports_base_url: str = Field(
         "http://reports:8000/",
         alias="INPLAY_REPORTS_BASE_URL",
@@ -48,6 +58,31 @@ class Settings(BaseSettings):
         alias="INPLAY_MARKET_DATA_TIMEOUT_SECONDS",
         description="Délai d'expiration pour les appels au market-data service",
     )
+    reports_cache_ttl_seconds: float = Field(
+        30.0,
+        alias="INPLAY_REPORTS_CACHE_TTL_SECONDS",
+        description="Durée de fraîcheur des réponses du reports-service en cache",
+    )
+    market_data_cache_ttl_seconds: float = Field(
+        2.0,
+        alias="INPLAY_MARKET_DATA_CACHE_TTL_SECONDS",
+        description="Durée de fraîcheur des réponses du market-data service en cache",
+    )
+    http_cache_stale_seconds: float = Field(
+        300.0,
+        alias="INPLAY_HTTP_CACHE_STALE_SECONDS",
+        description="Durée pendant laquelle une réponse expirée reste servie en cas de panne",
+    )
+    tick_stream_key: str = Field(
+        "market-data",
+        alias="INPLAY_TICK_STREAM_KEY",
+        description="Clé du Redis Stream alimenté par les ticks de marché",
+    )
+    broadcast_debounce_seconds: float = Field(
+        0.05,
+        alias="INPLAY_BROADCAST_DEBOUNCE_SECONDS",
+        description="Fenêtre de regroupement des diffusions WebSocket par watchlist",
+    )
 
 
 @functools.lru_cache
@@ -2,16 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from contextlib import suppress
+from functools import partial
 from typing import Annotated, Callable
-from urllib.parse import urljoin
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+import orjson
+import redis.asyncio as redis
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from libs.observability.logging import RequestContextMiddleware, configure_logging
 from libs.observability.metrics import setup_metrics
 
+from .cache import CachedRequest, DownstreamCache, DownstreamUnavailable
 from .config import Settings, get_settings
 from .schemas import (
     SessionName,
@@ -21,13 +38,33 @@ from .schemas import (
     WatchlistStreamEvent,
 )
 from .state import InPlayState
-from .stream import RedisTickStream, SimulatedTickStream, TickStream
+from .stream import RedisTickStream, SimulatedTickStream, TickStream, settings_connection_pool
+
+# Built once at import; dump_json yields the response bytes directly.
+_REPORT_ADAPTER = TypeAdapter(StrategyReportPayload)
 
 
 class WebSocketManager:
-    def __init__(self) -> None:
+    def __init__(self, send_timeout: float = 1.0, max_cached_frames: int = 32) -> None:
         self._connections: set[WebSocket] = set()
         self._lock = asyncio.Lock()
+        self._send_timeout = send_timeout
+        # Encoded frames keyed by snapshot identity; unchanged watchlists republish the
+        # same snapshot object, so their frame is reused rather than re-encoded.
+        self._frames: OrderedDict[int, tuple[WatchlistSnapshot, str]] = OrderedDict()
+        self._max_cached_frames = max_cached_frames
+
+    def encode(self, event: WatchlistStreamEvent) -> str:
+        key = id(event.payload)
+        cached = self._frames.get(key)
+        if cached is not None and cached[0] is event.payload:
+            self._frames.move_to_end(key)
+            return cached[1]
+        frame = event.model_dump_json()
+        self._frames[key] = (event.payload, frame)
+        if len(self._frames) > self._max_cached_frames:
+            self._frames.popitem(last=False)
+        return frame
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
@@ -39,20 +76,101 @@ class WebSocketManager:
             self._connections.discard(websocket)
 
     async def broadcast(self, event: WatchlistStreamEvent) -> None:
-        message = event.model_dump(mode="json")
+        message = self.encode(event)
         async with self._lock:
             connections = list(self._connections)
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                await self.disconnect(websocket)
+        if not connections:
+            return
+        results = await asyncio.gather(
+            *(self._send(websocket, message) for websocket in connections),
+            return_exceptions=True,
+        )
+        failed = [
+            websocket
+            for websocket, result in zip(connections, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            await self._disconnect_many(failed)
+
+    async def _send(self, websocket: WebSocket, message: str) -> None:
+        # A stalled client must not hold up the fan-out to everyone else.
+        await asyncio.wait_for(websocket.send_text(message), timeout=self._send_timeout)
+
+    async def _disconnect_many(self, websockets: list[WebSocket]) -> None:
+        async with self._lock:
+            self._connections.difference_update(websockets)
+        # A failed or cancelled send may have left a partial frame on the wire: close the
+        # socket so the client reconnects and resyncs instead of silently going stale.
+        await asyncio.gather(*(self._close(websocket) for websocket in websockets))
+
+    async def _close(self, websocket: WebSocket) -> None:
+        with suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=status.WS_1011_INTERNAL_ERROR), timeout=self._send_timeout
+            )
+
+
+class BroadcastQueue:
+    """Bounded hand-off between tick ingest and the WebSocket fan-out.
+
+    A watchlist is released at most once per debounce window and only its
+    latest snapshot is kept while it waits; the oldest pending watchlist is
+    dropped on overflow, so ingest never blocks on slow clients.
+    """
+
+    def __init__(self, maxsize: int = 1000, debounce_seconds: float = 0.05) -> None:
+        self._queue: asyncio.Queue[tuple[float, str]] = asyncio.Queue(maxsize=maxsize)
+        self._pending: dict[str, WatchlistSnapshot] = {}
+        self._debounce_seconds = debounce_seconds
+
+    def put(self, snapshot: WatchlistSnapshot) -> None:
+        if snapshot.id in self._pending:
+            self._pending[snapshot.id] = snapshot
+            return
+        if self._queue.full():
+            _, dropped = self._queue.get_nowait()
+            self._pending.pop(dropped, None)
+        self._pending[snapshot.id] = snapshot
+        self._queue.put_nowait((time.monotonic() + self._debounce_seconds, snapshot.id))
+
+    async def get(self) -> WatchlistSnapshot:
+        while True:
+            due, watchlist_id = await self._queue.get()
+            delay = due - time.monotonic()
+            if delay > 0:
+                # Ticks arriving meanwhile replace the pending snapshot.
+                await asyncio.sleep(delay)
+            snapshot = self._pending.pop(watchlist_id, None)
+            if snapshot is not None:
+                return snapshot
 
 
 def _default_stream_factory() -> TickStream:
     return RedisTickStream()
 
 
+def _normalise_base_url(value: str) -> str:
+    return value if value.endswith("/") else f"{value}/"
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Return the app-wide downstream client created by the lifespan handler."""
+
+    client = getattr(request.app.state, "http_client", None)
+    if client is None:
+        # Served without lifespan events (e.g. bare ASGI transports).
+        client = request.app.state.http_client = _new_http_client()
+    return client
+
+
 configure_logging("inplay")
 
 logger = logging.getLogger(__name__)
@@ -65,31 +183,62 @@ def create_app(
     settings = settings or get_settings()
     state = InPlayState(settings.watchlists)
     manager = WebSocketManager()
-
-    async def _consumer(stream: TickStream) -> None:
+    http_cache = DownstreamCache(
+        redis.Redis(connection_pool=settings_connection_pool(settings)),
+        stale_ttl=settings.http_cache_stale_seconds,
+    )
+    # Downstream endpoints only vary by symbol: resolve the settings once.
+    reports_base = _normalise_base_url(settings.reports_base_url)
+    market_base = _normalise_base_url(settings.market_data_base_url)
+    reports_timeout = settings.reports_timeout_seconds
+    reports_ttl = settings.reports_cache_ttl_seconds
+    market_timeout = settings.market_data_timeout_seconds
+    market_ttl = settings.market_data_cache_ttl_seconds
+
+    async def _consumer(stream: TickStream, queue: BroadcastQueue) -> None:
         async for payload in stream.listen():
-            snapshots = await state.apply_tick(payload)
-            for snapshot in snapshots:
-                await manager.broadcast(WatchlistStreamEvent(payload=snapshot))
+            for snapshot in await state.apply_tick(payload):
+                queue.put(snapshot)
+
+    async def _broadcaster(queue: BroadcastQueue) -> None:
+        while True:
+            snapshot = await queue.get()
+            # Snapshots are built from validated ticks; skip re-validation.
+            await manager.broadcast(WatchlistStreamEvent.model_construct(payload=snapshot))
 
     async def lifespan(app: FastAPI):
         stream = (stream_factory or _default_stream_factory)()
-        consumer_task = asyncio.create_task(_consumer(stream))
+        queue = BroadcastQueue(debounce_seconds=settings.broadcast_debounce_seconds)
+        consumer_task = asyncio.create_task(_consumer(stream, queue))
+        broadcaster_task = asyncio.create_task(_broadcaster(queue))
         app.state.tick_stream = stream
+        app.state.broadcast_queue = queue
         app.state.consumer_task = consumer_task
+        app.state.broadcaster_task = broadcaster_task
+        app.state.http_client = _new_http_client()
         yield
-        consumer_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await consumer_task
+        for task in (consumer_task, broadcaster_task):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await app.state.http_client.aclose()
+        del app.state.http_client
+        await http_cache.close()
         close = getattr(stream, "close", None)
         if close is not None:
             result = close()
             if asyncio.iscoroutine(result):
                 await result
 
-    app = FastAPI(title="In-Play Service", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(
+        title="In-Play Service",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     app.state.inplay_state = state
     app.state.websocket_manager = manager
+    app.state.http_cache = http_cache
     app.add_middleware(RequestContextMiddleware, service_name="inplay")
     setup_metrics(app, service_name="inplay")
 
@@ -99,9 +248,6 @@ def create_app(
     async def get_manager() -> WebSocketManager:
         return manager
 
-    def _normalise_base_url(value: str) -> str:
-        return value if value.endswith("/") else f"{value}/"
-
     async def _fetch_json(
         client: httpx.AsyncClient, url: str, timeout: float
     ) -> dict[str, object] | None:
@@ -112,12 +258,18 @@ def create_app(
             if exc.response.status_code == 404:
                 return None
             logger.warning("Requête HTTP échouée vers %s: %s", url, exc)
-            return None
+            raise DownstreamUnavailable(url) from exc
         except httpx.HTTPError as exc:
             logger.warning("Impossible d'appeler %s: %s", url, exc)
-            return None
+            raise DownstreamUnavailable(url) from exc
 
-        payload = response.json()
+        try:
+            # orjson parses the raw bytes directly; httpx's .json() goes through stdlib json.
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            # Treated like an outage so the other lookups of the fan-out still succeed.
+            logger.warning("Réponse non JSON reçue depuis %s: %s", url, exc)
+            raise DownstreamUnavailable(url) from exc
         if isinstance(payload, dict):
             return payload
         logger.warning("Payload inattendu reçu depuis %s: %s", url, payload)
@@ -127,18 +279,28 @@ def create_app(
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
-    @app.get("/inplay/watchlists/{watchlist_id}", response_model=WatchlistSnapshot)
+    def _json_response(adapter: TypeAdapter, model: object) -> Response:
+        # Models returned here are built internally; skip response_model re-validation.
+        return Response(content=adapter.dump_json(model), media_type="application/json")
+
+    @app.get(
+        "/inplay/watchlists/{watchlist_id}",
+        response_model=None,
+        responses={200: {"model": WatchlistSnapshot}},
+    )
     async def get_watchlist(
         watchlist_id: str,
         session: Annotated[SessionName | None, Query()] = None,
         state: InPlayState = Depends(get_state),
-    ) -> WatchlistSnapshot:
+    ) -> Response:
         try:
-            return await state.get_watchlist(watchlist_id, session=session)
+            # Served from the serialised snapshot cached until the next tick.
+            content = await state.get_watchlist_json(watchlist_id, session=session)
         except KeyError as exc:
             raise HTTPException(
                 status_code=404, detail=f"Unknown watchlist '{watchlist_id}'"
             ) from exc
+        return Response(content=content, media_type="application/json")
 
     @app.websocket("/inplay/ws")
     async def inplay_ws(
@@ -150,8 +312,8 @@ def create_app(
         try:
             snapshots = await state.list_watchlists()
             for snapshot in snapshots:
-                await websocket.send_json(
-                    WatchlistStreamEvent(payload=snapshot).model_dump(mode="json")
+                await websocket.send_text(
+                    manager.encode(WatchlistStreamEvent.model_construct(payload=snapshot))
                 )
             while True:
                 await websocket.receive_text()
@@ -160,39 +322,29 @@ def create_app(
 
     @app.get(
         "/inplay/setups/{symbol}/{strategy}",
-        response_model=StrategyReportPayload,
+        response_model=None,
+        responses={200: {"model": StrategyReportPayload}},
         tags=["inplay"],
     )
     async def get_strategy_report(
         symbol: str,
         strategy: str,
         state: InPlayState = Depends(get_state),
-    ) -> StrategyReportPayload:
+        client: httpx.AsyncClient = Depends(get_http_client),
+    ) -> Response:
         setup = await state.get_strategy_setup(symbol, strategy)
         if setup is None:
             raise HTTPException(status_code=404, detail="Setup introuvable")
 
-        reports_base = _normalise_base_url(settings.reports_base_url)
-        market_base = _normalise_base_url(settings.market_data_base_url)
-        reports_endpoint = urljoin(reports_base, f"symbols/{setup.symbol}/summary")
-        market_endpoint = urljoin(market_base, f"spot/{setup.symbol}")
-
-        async with httpx.AsyncClient() as client:
-            report_task = _fetch_json(
-                client,
-                reports_endpoint,
-                settings.reports_timeout_seconds,
-            )
-            market_task = _fetch_json(
-                client,
-                market_endpoint,
-                settings.market_data_timeout_seconds,
-            )
-            report_payload, market_payload = await asyncio.gather(
-                report_task,
-                market_task,
-                return_exceptions=False,
-            )
+        report_payload, market_payload = await http_cache.fetch_many(
+            [
+                CachedRequest(
+                    f"{reports_base}symbols/{setup.symbol}/summary", reports_timeout, reports_ttl
+                ),
+                CachedRequest(f"{market_base}spot/{setup.symbol}", market_timeout, market_ttl),
+            ],
+            partial(_fetch_json, client),
+        )
 
         report_data = None
         risk_data = None
@@ -204,7 +356,7 @@ def create_app(
             if isinstance(risk_section, dict):
                 risk_data = risk_section
 
-        return StrategyReportPayload(
+        payload = StrategyReportPayload.model_construct(
             symbol=setup.symbol,
             strategy=setup.strategy,
             session=setup.session,
@@ -213,6 +365,7 @@ def create_app(
             risk=risk_data,
             market=market_payload,
         )
+        return _json_response(_REPORT_ADAPTER, payload)
 
     return app
 
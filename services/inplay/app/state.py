@@ -1,62 +1,125 @@
 from __future__ import annotations
 
-import asyncio
+import itertools
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Iterable, Tuple
 from urllib.parse import quote
 
+from pydantic import TypeAdapter
+
 from .schemas import SessionName, StrategySetup, SymbolSetups, TickPayload, WatchlistSnapshot
 
+_SNAPSHOT_ADAPTER = TypeAdapter(WatchlistSnapshot)
+
+
+@lru_cache(maxsize=4096)
+def _build_report_url(symbol: str, strategy: str) -> str:
+    return f"/inplay/setups/{quote(symbol, safe='')}/{quote(strategy, safe='')}"
+
 
 class WatchlistState:
     def __init__(self, watchlist_id: str, symbols: Iterable[str]):
         self.id = watchlist_id
         self.symbols = list(symbols)
-        self._setups: dict[str, dict[Tuple[str, SessionName], StrategySetup]] = {}
+        self._symbol_set = frozenset(self.symbols)
+        # Per-symbol (strategy, session) index ordered by ``updated_at``, newest first.
+        # Ticks normally arrive in time order, so a write only moves its setup to the
+        # front; snapshots need no sort and rebuilding a symbol walks only its setups.
+        self._setups: dict[str, OrderedDict[Tuple[str, SessionName], StrategySetup]] = {
+            symbol: OrderedDict() for symbol in self._symbol_set
+        }
         self.updated_at: datetime | None = None
+        # Unfiltered snapshots are rebuilt only for symbols touched since the last call.
+        self._symbol_snapshots: dict[str, SymbolSetups] = {}
+        self._dirty_symbols: set[str] = set(self.symbols)
+        self._snapshot_cache: WatchlistSnapshot | None = None
+        # Serialised snapshots per session filter, dropped on every write.
+        self._encoded: dict[SessionName | None, bytes] = {}
 
     def apply_setup(self, setup: StrategySetup) -> bool:
-        if setup.symbol not in self.symbols:
+        if setup.symbol not in self._symbol_set:
             return False
-        symbol_setups = self._setups.setdefault(setup.symbol, {})
-        symbol_setups[(setup.strategy, setup.session)] = setup
+        setups = self._setups[setup.symbol]
+        key = (setup.strategy, setup.session)
+        newest = next((item for item_key, item in setups.items() if item_key != key), None)
+        setups[key] = setup
+        if newest is None or setup.updated_at >= newest.updated_at:
+            setups.move_to_end(key, last=False)
+        else:
+            # Out-of-order tick: re-sort this symbol so snapshots stay newest first.
+            self._setups[setup.symbol] = OrderedDict(
+                sorted(setups.items(), key=lambda item: item[1].updated_at, reverse=True)
+            )
         self.updated_at = setup.updated_at
+        self._dirty_symbols.add(setup.symbol)
+        self._snapshot_cache = None
+        self._encoded.clear()
         return True
 
     def snapshot(self, session: SessionName | None = None) -> WatchlistSnapshot:
-        symbols: list[SymbolSetups] = []
-        for symbol in self.symbols:
-            setups = list(self._setups.get(symbol, {}).values())
-            if session is not None:
-                setups = [item for item in setups if item.session == session]
-            setups.sort(key=lambda item: item.updated_at, reverse=True)
-            symbols.append(SymbolSetups(symbol=symbol, setups=setups))
-        return WatchlistSnapshot(id=self.id, symbols=symbols, updated_at=self.updated_at)
+        if session is not None:
+            symbols = [
+                SymbolSetups.model_construct(
+                    symbol=symbol, setups=self._symbol_setups(symbol, session)
+                )
+                for symbol in self.symbols
+            ]
+            return WatchlistSnapshot.model_construct(
+                id=self.id, symbols=symbols, updated_at=self.updated_at
+            )
+        if self._snapshot_cache is None:
+            for symbol in self._dirty_symbols:
+                self._symbol_snapshots[symbol] = SymbolSetups.model_construct(
+                    symbol=symbol, setups=self._symbol_setups(symbol)
+                )
+            self._dirty_symbols.clear()
+            self._snapshot_cache = WatchlistSnapshot.model_construct(
+                id=self.id,
+                symbols=[self._symbol_snapshots[symbol] for symbol in self.symbols],
+                updated_at=self.updated_at,
+            )
+        return self._snapshot_cache
+
+    def snapshot_json(self, session: SessionName | None = None) -> bytes:
+        encoded = self._encoded.get(session)
+        if encoded is None:
+            encoded = self._encoded[session] = _SNAPSHOT_ADAPTER.dump_json(self.snapshot(session))
+        return encoded
+
+    def _symbol_setups(
+        self, symbol: str, session: SessionName | None = None
+    ) -> list[StrategySetup]:
+        setups = self._setups[symbol]
+        if session is None:
+            return list(setups.values())
+        return [setup for (_, setup_session), setup in setups.items() if setup_session == session]
 
     def iter_setups(self, symbol: str | None = None) -> Iterable[StrategySetup]:
-        if symbol is not None:
-            yield from self._setups.get(symbol, {}).values()
-            return
-        for setups in self._setups.values():
-            yield from setups.values()
+        if symbol is None:
+            return itertools.chain.from_iterable(
+                setups.values() for setups in self._setups.values()
+            )
+        setups = self._setups.get(symbol)
+        return setups.values() if setups is not None else ()
 
 
 class InPlayState:
+    # No lock: every mutation below runs to completion without awaiting, so on the
+    # event loop readers always observe a consistent state. Unfiltered snapshots are
+    # immutable objects republished by rebinding, so reads never wait on tick ingest.
     def __init__(self, watchlists: Dict[str, Iterable[str]]):
-        self._lock = asyncio.Lock()
         self._watchlists: dict[str, WatchlistState] = {
             watchlist_id: WatchlistState(watchlist_id, symbols)
             for watchlist_id, symbols in watchlists.items()
         }
+        # Latest setup per (symbol, lower-cased strategy) across all watchlists.
+        self._latest_by_symbol_strategy: dict[tuple[str, str], StrategySetup] = {}
 
     async def apply_tick(self, payload: TickPayload) -> list[WatchlistSnapshot]:
-        report_url = payload.report_url
-        if not report_url:
-            encoded_symbol = quote(payload.symbol, safe="")
-            encoded_strategy = quote(payload.strategy, safe="")
-            report_url = f"/inplay/setups/{encoded_symbol}/{encoded_strategy}"
-
-        setup = StrategySetup(
+        # The tick was validated on ingress, so the setup is built without re-validation.
+        setup = StrategySetup.model_construct(
             symbol=payload.symbol,
             strategy=payload.strategy,
             entry=payload.entry,
@@ -66,41 +129,48 @@ class InPlayState:
             status=payload.status,
             session=payload.session,
             updated_at=payload.received_at,
-            report_url=report_url,
+            report_url=payload.report_url or _build_report_url(payload.symbol, payload.strategy),
         )
-        async with self._lock:
-            updated: list[WatchlistSnapshot] = []
-            target_watchlists = payload.watchlists or list(self._watchlists.keys())
-            for watchlist_id in target_watchlists:
-                watchlist = self._watchlists.get(watchlist_id)
-                if watchlist and watchlist.apply_setup(setup):
-                    updated.append(watchlist.snapshot())
-            return updated
+        updated: list[WatchlistSnapshot] = []
+        target_watchlists = payload.watchlists or list(self._watchlists.keys())
+        for watchlist_id in target_watchlists:
+            watchlist = self._watchlists.get(watchlist_id)
+            if watchlist and watchlist.apply_setup(setup):
+                updated.append(watchlist.snapshot())
+        if updated:
+            self._index_setup(setup)
+        return updated
+
+    def _index_setup(self, setup: StrategySetup) -> None:
+        key = (setup.symbol, setup.strategy.lower())
+        current = self._latest_by_symbol_strategy.get(key)
+        if current is None or setup.updated_at >= current.updated_at:
+            self._latest_by_symbol_strategy[key] = setup
 
     async def get_strategy_setup(self, symbol: str, strategy: str) -> StrategySetup | None:
-        async with self._lock:
-            candidates: list[StrategySetup] = []
-            for watchlist in self._watchlists.values():
-                for item in watchlist.iter_setups(symbol=symbol):
-                    if item.strategy.lower() == strategy.lower():
-                        candidates.append(item)
-            if not candidates:
-                return None
-            candidates.sort(key=lambda item: item.updated_at, reverse=True)
-            return candidates[0]
+        return self._latest_by_symbol_strategy.get((symbol, strategy.lower()))
 
     async def get_watchlist(
         self, watchlist_id: str, session: SessionName | None = None
     ) -> WatchlistSnapshot:
-        async with self._lock:
-            if watchlist_id not in self._watchlists:
-                raise KeyError(watchlist_id)
-            return self._watchlists[watchlist_id].snapshot(session=session)
+        if watchlist_id not in self._watchlists:
+            raise KeyError(watchlist_id)
+        return self._watchlists[watchlist_id].snapshot(session=session)
+
+    async def get_watchlist_json(
+        self, watchlist_id: str, session: SessionName | None = None
+    ) -> bytes:
+        if watchlist_id not in self._watchlists:
+            raise KeyError(watchlist_id)
+        return self._watchlists[watchlist_id].snapshot_json(session=session)
 
     async def list_watchlists(self) -> list[WatchlistSnapshot]:
-        async with self._lock:
-            return [watchlist.snapshot() for watchlist in self._watchlists.values()]
+        return [watchlist.snapshot() for watchlist in self._watchlists.values()]
 
     async def register_watchlist(self, watchlist_id: str, symbols: Iterable[str]) -> None:
-        async with self._lock:
-            self._watchlists[watchlist_id] = WatchlistState(watchlist_id, symbols)
+        self._watchlists[watchlist_id] = WatchlistState(watchlist_id, symbols)
+        # Setups held only by the replaced watchlist must drop out of the index.
+        self._latest_by_symbol_strategy.clear()
+        for watchlist in self._watchlists.values():
+            for setup in watchlist.iter_setups():
+                self._index_setup(setup)
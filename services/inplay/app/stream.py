@@ -1,38 +1,80 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import threading
 from typing import AsyncIterator, Protocol
 
 import redis.asyncio as redis
+from pydantic import TypeAdapter
 
-from .config import get_settings
+from .config import Settings, get_settings
 from .schemas import TickPayload
 
+# Built once: validates each tick straight from the raw JSON bytes.
+_TICK_ADAPTER = TypeAdapter(TickPayload)
+
 
 class TickStream(Protocol):
     async def listen(self) -> AsyncIterator[TickPayload]: ...
 
 
+@functools.lru_cache
+def shared_connection_pool(
+    redis_url: str, max_connections: int = 20, timeout: float = 1.0
+) -> redis.ConnectionPool:
+    # Keep payloads as bytes: validate_json parses them in pydantic-core
+    # without an intermediate str (faster than orjson + model_validate).
+    # A blocking pool queues callers for up to ``timeout`` seconds once every connection
+    # is in use, instead of failing at once and pushing the cache onto its fallback path.
+    return redis.BlockingConnectionPool.from_url(
+        redis_url, max_connections=max_connections, timeout=timeout, decode_responses=False
+    )
+
+
+def settings_connection_pool(settings: Settings) -> redis.ConnectionPool:
+    return shared_connection_pool(
+        settings.redis_url, settings.redis_max_connections, settings.redis_pool_timeout_seconds
+    )
+
+
 class RedisTickStream:
-    def __init__(self, channel: str = "market-data") -> None:
+    """Consume ticks from a Redis Stream with plain ``XREAD``.
+
+    Producers ``XADD <stream> * data <json>``. Every replica keeps its own in-memory
+    state, so each one reads the whole stream from where it joined instead of sharing
+    a consumer group; there is no pending list to acknowledge or reclaim.
+    """
+
+    def __init__(
+        self,
+        stream: str | None = None,
+        *,
+        batch_size: int = 100,
+        block_ms: int = 100,
+    ) -> None:
         self._settings = get_settings()
-        self._channel = channel
-        self._client = redis.from_url(self._settings.redis_url)
+        self._stream = stream or self._settings.tick_stream_key
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._client = redis.Redis(connection_pool=settings_connection_pool(self._settings))
+
+    async def _latest_id(self) -> bytes:
+        # Start after the newest entry; reading from "$" on every poll would drop ticks
+        # added between two calls.
+        latest = await self._client.xrevrange(self._stream, count=1)
+        return latest[0][0] if latest else b"0-0"
 
     async def listen(self) -> AsyncIterator[TickPayload]:
-        pubsub = self._client.pubsub()
-        await pubsub.subscribe(self._channel)
-        try:
-            async for message in pubsub.listen():
-                if message["type"] != "message":
-                    continue
-                payload = TickPayload.model_validate_json(message["data"])
-                yield payload
-        finally:
-            await pubsub.unsubscribe(self._channel)
-            await pubsub.close()
-            await self._client.close()
+        last_id = await self._latest_id()
+        while True:
+            response = await self._client.xread(
+                {self._stream: last_id}, count=self._batch_size, block=self._block_ms
+            )
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    yield _TICK_ADAPTER.validate_json(fields[b"data"])
 
 
 class SimulatedTickStream:
@@ -49,21 +91,28 @@ class SimulatedTickStream:
             await self._queue.put(self._pending.pop(0))
         while True:
             payload = await self._queue.get()
+            # Drain whatever else is already queued before waiting again, so a burst
+            # of publishes costs one wakeup instead of one per tick.
+            while payload is not None:
+                yield payload
+                try:
+                    payload = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
             if payload is None:
                 break
-            yield payload
 
     def publish(self, payload: TickPayload) -> None:
         if not self._ready.is_set():
             self._pending.append(payload)
             return
         assert self._loop is not None
-        fut = asyncio.run_coroutine_threadsafe(self._queue.put(payload), self._loop)
-        fut.result()
+        # Fire and forget: callbacks run in FIFO order on the loop, so ordering is kept
+        # without blocking the publisher on a loop turn.
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, payload)
 
     def close(self) -> None:
         if not self._ready.wait(timeout=1):
             return
         assert self._loop is not None
-        fut = asyncio.run_coroutine_threadsafe(self._queue.put(None), self._loop)
-        fut.result()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from services.inplay.app.cache import CachedRequest, DownstreamCache, DownstreamUnavailable
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class InMemoryRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.expiries: dict[str, int] = {}
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryPipeline":
+        return InMemoryPipeline(self)
+
+
+class InMemoryPipeline:
+    def __init__(self, redis: InMemoryRedis) -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, bytes, int]] = []
+
+    async def __aenter__(self) -> "InMemoryPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self._commands.append((key, value, ex))
+
+    async def execute(self) -> None:
+        for key, value, ex in self._commands:
+            self._redis.values[key] = value
+            self._redis.expiries[key] = ex
+
+
+async def test_fetch_many_serves_fresh_entries_and_falls_back_to_stale() -> None:
+    redis = InMemoryRedis()
+    cache = DownstreamCache(redis, stale_ttl=60)
+    calls: list[str] = []
+    available = True
+
+    async def fetch(url: str, timeout: float) -> dict[str, object] | None:
+        calls.append(url)
+        if not available:
+            raise DownstreamUnavailable(url)
+        return {"url": url}
+
+    requests = [
+        CachedRequest("http://reports.test/a", timeout=1.0, ttl=30),
+        CachedRequest("http://market.test/b", timeout=1.0, ttl=0),
+    ]
+
+    first = await cache.fetch_many(requests, fetch)
+    second = await cache.fetch_many(requests, fetch)
+    available = False
+    third = await cache.fetch_many(requests, fetch)
+
+    assert first == second == third
+    assert third[1] == {"url": "http://market.test/b"}
+    assert calls == [
+        "http://reports.test/a",
+        "http://market.test/b",
+        "http://market.test/b",
+        "http://market.test/b",
+    ]
+    assert redis.expiries[cache.key_for("http://reports.test/a")] == 90
+
+
+async def test_fetch_many_does_not_cache_missing_resources() -> None:
+    redis = InMemoryRedis()
+    cache = DownstreamCache(redis, stale_ttl=60)
+
+    async def fetch(url: str, timeout: float) -> dict[str, object] | None:
+        return None
+
+    result = await cache.fetch_many([CachedRequest("http://reports.test/a", 1.0, 30)], fetch)
+
+    assert result == [None]
+    assert redis.values == {}
@@ -1,12 +1,44 @@
 from __future__ import annotations
 
-import time
+import asyncio
+from typing import Awaitable, Callable
 
 from fastapi.testclient import TestClient
 
 from services.inplay.app.config import Settings
 from services.inplay.app.main import SimulatedTickStream, create_app
-from services.inplay.app.schemas import TickPayload
+from services.inplay.app.schemas import TickPayload, WatchlistSnapshot
+from services.inplay.app.state import InPlayState
+
+
+def await_update(
+    client: TestClient,
+    condition: Callable[[InPlayState], Awaitable[bool]],
+    timeout: float = 1.0,
+) -> None:
+    """Block until ``condition`` holds, waking only when a tick changes a watchlist."""
+
+    state: InPlayState = client.app.state.inplay_state
+
+    async def _wait() -> None:
+        updated = asyncio.Event()
+
+        async def apply_and_signal(payload: TickPayload) -> list[WatchlistSnapshot]:
+            snapshots = await InPlayState.apply_tick(state, payload)
+            if snapshots:
+                updated.set()
+            return snapshots
+
+        state.apply_tick = apply_and_signal  # type: ignore[method-assign]
+        try:
+            async with asyncio.timeout(timeout):
+                while not await condition(state):
+                    updated.clear()
+                    await updated.wait()
+        finally:
+            del state.apply_tick
+
+    client.portal.call(_wait)
 
 
 def test_tick_stream_updates_watchlist_and_websocket() -> None:
@@ -30,17 +62,14 @@ def test_tick_stream_updates_watchlist_and_websocket() -> None:
         assert stream._ready.wait(timeout=1.0)
         stream.publish(payload)
 
-        deadline = time.time() + 1.0
-        data = None
-        while time.time() < deadline:
-            response = client.get("/inplay/watchlists/momentum")
-            assert response.status_code == 200
-            data = response.json()
-            setups = data["symbols"][0]["setups"]
-            if setups:
-                break
-            time.sleep(0.05)
-        assert data is not None
+        async def has_setup(state: InPlayState) -> bool:
+            snapshot = await state.get_watchlist("momentum")
+            return bool(snapshot.symbols[0].setups)
+
+        await_update(client, has_setup)
+        response = client.get("/inplay/watchlists/momentum")
+        assert response.status_code == 200
+        data = response.json()
         setups = data["symbols"][0]["setups"]
         assert setups[0]["strategy"] == "ORB"
         assert setups[0]["probability"] == payload.probability
@@ -107,17 +136,11 @@ def test_watchlist_session_filtering() -> None:
         stream.publish(london_payload)
         stream.publish(asia_payload)
 
-        deadline = time.time() + 1.0
-        while time.time() < deadline:
-            response = client.get("/inplay/watchlists/momentum")
-            assert response.status_code == 200
-            data = response.json()
-            setups = data["symbols"][0]["setups"]
-            if len(setups) >= 2:
-                break
-            time.sleep(0.05)
-        else:
-            raise AssertionError("Setups not available in time")
+        async def has_both_sessions(state: InPlayState) -> bool:
+            snapshot = await state.get_watchlist("momentum")
+            return len(snapshot.symbols[0].setups) >= 2
+
+        await_update(client, has_both_sessions)
 
         response = client.get("/inplay/watchlists/momentum", params={"session": "asia"})
         assert response.status_code == 200
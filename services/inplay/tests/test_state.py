@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.inplay.app.schemas import StrategySetup, TickPayload
+from services.inplay.app.state import InPlayState, WatchlistState
+
+BASE_TIME = datetime(2024, 1, 2, 9, 30)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def make_setup(symbol: str, strategy: str, minutes: int = 0) -> StrategySetup:
+    return StrategySetup(
+        symbol=symbol,
+        strategy=strategy,
+        entry=100.0,
+        target=101.0,
+        stop=99.0,
+        probability=0.6,
+        updated_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def test_snapshot_only_rebuilds_touched_symbols() -> None:
+    watchlist = WatchlistState("momentum", ["AAPL", "MSFT"])
+    watchlist.apply_setup(make_setup("AAPL", "ORB"))
+    watchlist.apply_setup(make_setup("MSFT", "ORB"))
+    first = watchlist.snapshot()
+
+    assert watchlist.snapshot() is first
+
+    watchlist.apply_setup(make_setup("AAPL", "Breakout", minutes=1))
+    second = watchlist.snapshot()
+
+    assert second is not first
+    assert second.symbols[1] is first.symbols[1]
+    assert [item.strategy for item in second.symbols[0].setups] == ["Breakout", "ORB"]
+    assert second.model_dump(mode="json")["updated_at"] == "2024-01-02T09:31:00"
+
+
+def test_snapshot_lists_latest_written_setup_first() -> None:
+    watchlist = WatchlistState("momentum", ["AAPL"])
+    watchlist.apply_setup(make_setup("AAPL", "ORB"))
+    watchlist.apply_setup(make_setup("AAPL", "Breakout", minutes=1))
+    watchlist.apply_setup(make_setup("AAPL", "ORB", minutes=2))
+
+    setups = watchlist.snapshot().symbols[0].setups
+
+    assert [item.strategy for item in setups] == ["ORB", "Breakout"]
+    assert setups[0].updated_at == BASE_TIME + timedelta(minutes=2)
+
+
+def test_snapshot_orders_out_of_order_ticks_by_updated_at() -> None:
+    watchlist = WatchlistState("momentum", ["AAPL"])
+    watchlist.apply_setup(make_setup("AAPL", "ORB", minutes=5))
+    watchlist.apply_setup(make_setup("AAPL", "Breakout", minutes=1))
+    watchlist.apply_setup(make_setup("AAPL", "Gap-Fill", minutes=3))
+
+    assert [item.strategy for item in watchlist.snapshot().symbols[0].setups] == [
+        "ORB",
+        "Gap-Fill",
+        "Breakout",
+    ]
+
+    watchlist.apply_setup(make_setup("AAPL", "ORB", minutes=0))
+
+    assert [item.strategy for item in watchlist.snapshot().symbols[0].setups] == [
+        "Gap-Fill",
+        "Breakout",
+        "ORB",
+    ]
+
+
+def test_iter_setups_reads_only_the_requested_symbol() -> None:
+    watchlist = WatchlistState("momentum", ["AAPL", "MSFT"])
+    watchlist.apply_setup(make_setup("AAPL", "ORB"))
+    watchlist.apply_setup(make_setup("MSFT", "ORB", minutes=1))
+    watchlist.apply_setup(make_setup("AAPL", "Breakout", minutes=2))
+
+    assert [item.strategy for item in watchlist.iter_setups("AAPL")] == ["Breakout", "ORB"]
+    assert [item.symbol for item in watchlist.iter_setups("MSFT")] == ["MSFT"]
+    assert list(watchlist.iter_setups("TSLA")) == []
+    assert len(list(watchlist.iter_setups())) == 3
+
+
+def make_tick(symbol: str, strategy: str, minutes: int, watchlists: list[str]) -> TickPayload:
+    return TickPayload(
+        symbol=symbol,
+        strategy=strategy,
+        entry=100.0,
+        target=101.0,
+        stop=99.0,
+        probability=0.6,
+        watchlists=watchlists,
+        received_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+@pytest.mark.anyio
+async def test_get_strategy_setup_returns_latest_across_watchlists() -> None:
+    state = InPlayState({"momentum": ["AAPL"], "tech": ["AAPL"]})
+    await state.apply_tick(make_tick("AAPL", "ORB", 0, ["momentum"]))
+    await state.apply_tick(make_tick("AAPL", "ORB", 5, ["tech"]))
+    await state.apply_tick(make_tick("TSLA", "ORB", 6, ["tech"]))
+
+    latest = await state.get_strategy_setup("AAPL", "orb")
+
+    assert latest is not None
+    assert latest.updated_at == BASE_TIME + timedelta(minutes=5)
+    assert await state.get_strategy_setup("TSLA", "ORB") is None
+
+    await state.register_watchlist("tech", ["AAPL"])
+    latest = await state.get_strategy_setup("AAPL", "ORB")
+    assert latest is not None and latest.updated_at == BASE_TIME
+
+
+@pytest.mark.anyio
+async def test_apply_tick_returns_only_changed_watchlists() -> None:
+    state = InPlayState({"momentum": ["AAPL"], "futures": ["ES"]})
+
+    assert await state.apply_tick(make_tick("TSLA", "ORB", 0, ["momentum"])) == []
+
+    snapshots = await state.apply_tick(make_tick("AAPL", "ORB", 0, []))
+    assert [snapshot.id for snapshot in snapshots] == ["momentum"]
+
+
+def test_snapshot_json_is_cached_per_session_until_next_write() -> None:
+    watchlist = WatchlistState("momentum", ["AAPL"])
+    watchlist.apply_setup(make_setup("AAPL", "ORB"))
+
+    encoded = watchlist.snapshot_json()
+    london = watchlist.snapshot_json("london")
+
+    assert watchlist.snapshot_json() is encoded
+    assert watchlist.snapshot_json("london") is london
+    assert encoded == watchlist.snapshot().model_dump_json().encode()
+
+    watchlist.apply_setup(make_setup("AAPL", "Breakout", minutes=1))
+
+    assert watchlist.snapshot_json() is not encoded
+    assert b"Breakout" in watchlist.snapshot_json()
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from typing import Dict, Tuple
-from unittest.mock import patch
 
 import httpx
 import pytest
 
 from services.inplay.app.config import Settings
-from services.inplay.app.main import create_app
+from services.inplay.app.main import create_app, get_http_client
 from services.inplay.app.schemas import TickPayload
 
 pytestmark = pytest.mark.anyio
@@ -17,12 +16,6 @@ class DummyAsyncClient:
     def __init__(self, responses: Dict[str, Tuple[int, dict[str, object]]]):
         self._responses = responses
 
-    async def __aenter__(self) -> "DummyAsyncClient":
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> bool:
-        return False
-
     async def get(self, url: str, timeout: float | None = None) -> httpx.Response:
         status_code, payload = self._responses.get(url, (404, {}))
         request = httpx.Request("GET", url)
@@ -71,13 +64,11 @@ async def test_strategy_report_endpoint_returns_combined_payload() -> None:
         ),
     }
 
+    app.dependency_overrides[get_http_client] = lambda: DummyAsyncClient(responses)
+
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
-        with patch(
-            "services.inplay.app.main.httpx.AsyncClient",
-            lambda *args, **kwargs: DummyAsyncClient(responses),
-        ):
-            response = await client.get("/inplay/setups/AAPL/ORB")
+        response = await client.get("/inplay/setups/AAPL/ORB")
 
     assert response.status_code == 200
     payload_json = response.json()
@@ -89,6 +80,45 @@ async def test_strategy_report_endpoint_returns_combined_payload() -> None:
     assert payload_json["market"] == {"symbol": "AAPL", "bid": 189.9, "ask": 190.1}
 
 
+async def test_strategy_report_endpoint_keeps_report_when_market_body_is_invalid() -> None:
+    settings = Settings(
+        watchlists={"momentum": ["AAPL"]},
+        reports_base_url="http://reports.test/",
+        market_data_base_url="http://market.test/",
+    )
+    app = create_app(settings=settings, stream_factory=None)
+    await app.state.inplay_state.apply_tick(
+        TickPayload(
+            symbol="AAPL",
+            strategy="ORB",
+            entry=190.0,
+            target=191.0,
+            stop=189.0,
+            probability=0.6,
+            watchlists=["momentum"],
+        )
+    )
+
+    class BrokenMarketClient(DummyAsyncClient):
+        async def get(self, url: str, timeout: float | None = None) -> httpx.Response:
+            if url.startswith("http://market.test/"):
+                return httpx.Response(200, content=b"<html>", request=httpx.Request("GET", url))
+            return await super().get(url, timeout)
+
+    responses = {
+        "http://reports.test/symbols/AAPL/summary": (200, {"report": {"symbol": "AAPL"}}),
+    }
+    app.dependency_overrides[get_http_client] = lambda: BrokenMarketClient(responses)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/inplay/setups/AAPL/ORB")
+
+    assert response.status_code == 200
+    assert response.json()["report"] == {"symbol": "AAPL"}
+    assert response.json()["market"] is None
+
+
 async def test_strategy_report_endpoint_returns_404_when_setup_missing() -> None:
     settings = Settings(watchlists={"momentum": ["AAPL"]})
     app = create_app(settings=settings, stream_factory=None)
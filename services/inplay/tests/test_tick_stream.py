@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+import redis.asyncio as redis
+
+from services.inplay.app.config import Settings
+from services.inplay.app.schemas import TickPayload
+from services.inplay.app.stream import RedisTickStream, settings_connection_pool
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class InMemoryStreams:
+    def __init__(
+        self,
+        existing: list[tuple[bytes, dict[bytes, bytes]]],
+        batches: list[list[tuple[bytes, dict[bytes, bytes]]]],
+    ) -> None:
+        self._existing = existing
+        self._batches = batches
+        self.reads: list[dict[str, object]] = []
+
+    async def xrevrange(self, name: str, count: int) -> list[tuple[bytes, dict[bytes, bytes]]]:
+        return self._existing[::-1][:count]
+
+    async def xread(
+        self, streams: dict[str, bytes], count: int, block: int
+    ) -> list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]:
+        self.reads.append({"streams": dict(streams), "count": count, "block": block})
+        if not self._batches:
+            return []
+        return [(b"market-data", self._batches.pop(0))]
+
+
+def make_entry(entry_id: bytes, symbol: str) -> tuple[bytes, dict[bytes, bytes]]:
+    tick = TickPayload(
+        symbol=symbol, strategy="ORB", entry=100.0, target=101.0, stop=99.0, probability=0.6
+    )
+    return entry_id, {b"data": tick.model_dump_json().encode()}
+
+
+async def test_redis_tick_stream_reads_every_entry_after_the_latest() -> None:
+    client = InMemoryStreams(
+        [make_entry(b"0-1", "OLD")],
+        [
+            [make_entry(b"1-0", "AAPL"), make_entry(b"1-1", "MSFT")],
+            [],
+            [make_entry(b"2-0", "TSLA")],
+        ],
+    )
+    stream = RedisTickStream()
+    stream._client = client
+
+    ticks = stream.listen()
+    symbols = [(await ticks.__anext__()).symbol for _ in range(3)]
+    await ticks.aclose()
+
+    assert symbols == ["AAPL", "MSFT", "TSLA"]
+    assert [read["streams"] for read in client.reads] == [
+        {"market-data": b"0-1"},
+        {"market-data": b"1-1"},
+        {"market-data": b"1-1"},
+    ]
+    assert client.reads[0]["count"] == 100
+    assert client.reads[0]["block"] == 100
+
+
+async def test_redis_tick_stream_reads_an_empty_stream_from_the_start() -> None:
+    client = InMemoryStreams([], [[make_entry(b"1-0", "AAPL")]])
+    stream = RedisTickStream()
+    stream._client = client
+
+    ticks = stream.listen()
+    first = await ticks.__anext__()
+    await ticks.aclose()
+
+    assert first.symbol == "AAPL"
+    assert client.reads[0]["streams"] == {"market-data": b"0-0"}
+
+
+def test_connection_pool_queues_callers_instead_of_failing() -> None:
+    settings = Settings(
+        INPLAY_REDIS_URL="redis://localhost:6379/9",
+        INPLAY_REDIS_MAX_CONNECTIONS=5,
+        INPLAY_REDIS_POOL_TIMEOUT_SECONDS=0.5,
+    )
+
+    pool = settings_connection_pool(settings)
+
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 5
+    assert pool.timeout == 0.5
+    assert settings_connection_pool(settings) is pool
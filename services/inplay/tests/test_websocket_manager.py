@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from services.inplay.app.main import BroadcastQueue, WebSocketManager
+from services.inplay.app.schemas import WatchlistSnapshot, WatchlistStreamEvent
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class RecordingWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.messages: list[str] = []
+        self.close_codes: list[int] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+        if self.fail:
+            raise RuntimeError("connection closed")
+
+    async def send_text(self, message: str) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.messages.append(message)
+
+
+async def test_broadcast_drops_failed_and_stalled_connections() -> None:
+    manager = WebSocketManager(send_timeout=0.05)
+    healthy = RecordingWebSocket()
+    broken = RecordingWebSocket(fail=True)
+    stalled = RecordingWebSocket(delay=1.0)
+    for websocket in (healthy, broken, stalled):
+        await manager.connect(websocket)  # type: ignore[arg-type]
+
+    event = WatchlistStreamEvent.model_construct(
+        payload=WatchlistSnapshot(id="momentum", symbols=[])
+    )
+    await manager.broadcast(event)
+    await manager.broadcast(event)
+
+    assert len(healthy.messages) == 2
+    assert '"watchlist.update"' in healthy.messages[0]
+    assert broken.messages == [] and stalled.messages == []
+    assert manager._connections == {healthy}
+    assert broken.close_codes == [1011] and stalled.close_codes == [1011]
+    assert healthy.close_codes == []
+
+
+def test_encode_reuses_frame_for_the_same_snapshot() -> None:
+    manager = WebSocketManager()
+    snapshot = WatchlistSnapshot(id="momentum", symbols=[])
+
+    first = manager.encode(WatchlistStreamEvent.model_construct(payload=snapshot))
+    second = manager.encode(WatchlistStreamEvent.model_construct(payload=snapshot))
+    other = manager.encode(
+        WatchlistStreamEvent.model_construct(payload=WatchlistSnapshot(id="futures", symbols=[]))
+    )
+
+    assert first is second
+    assert json.loads(first) == {
+        "type": "watchlist.update",
+        "payload": {"id": "momentum", "symbols": [], "updated_at": None},
+    }
+    assert json.loads(other)["payload"]["id"] == "futures"
+
+
+async def test_broadcast_queue_coalesces_and_drops_oldest() -> None:
+    queue = BroadcastQueue(maxsize=2, debounce_seconds=0)
+    stale = WatchlistSnapshot(id="momentum", symbols=[])
+    latest = WatchlistSnapshot(id="momentum", symbols=[], updated_at=None)
+    queue.put(stale)
+    queue.put(latest)
+    queue.put(WatchlistSnapshot(id="futures", symbols=[]))
+    queue.put(WatchlistSnapshot(id="crypto", symbols=[]))
+
+    assert (await queue.get()).id == "futures"
+    assert (await queue.get()).id == "crypto"
+
+    queue.put(stale)
+    queue.put(latest)
+    assert await queue.get() is latest
+
+
+async def test_broadcast_queue_releases_latest_snapshot_after_debounce_window() -> None:
+    queue = BroadcastQueue(debounce_seconds=0.05)
+    queue.put(WatchlistSnapshot(id="momentum", symbols=[]))
+    pending = asyncio.ensure_future(queue.get())
+
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    latest = WatchlistSnapshot(id="momentum", symbols=[])
+    queue.put(latest)
+
+    assert await asyncio.wait_for(pending, timeout=1.0) is latest
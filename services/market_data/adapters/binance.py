@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Callable, Dict, Iterable, List
 
+import orjson
 from binance.spot import Spot
 from binance.websocket.websocket_client import BinanceWebsocketClient
 
@@ -16,6 +18,74 @@ from .rate_limiter import AsyncRateLimiter
 logger = logging.getLogger(__name__)
 
 
+def _filter_value(
+    filters_by_type: Dict[Any, Dict[str, Any]], filter_type: str, key: str
+) -> float | None:
+    """Read a numeric field from a symbol filter, ``None`` when the filter is absent."""
+
+    try:
+        return float(filters_by_type[filter_type].get(key, 0))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _parse_symbols(exchange_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalise the ``symbols`` section of Binance's exchange info."""
+
+    symbols: list[dict[str, Any]] = []
+    for entry in exchange_info.get("symbols", []):
+        filters_by_type = {filt.get("filterType"): filt for filt in entry.get("filters", ())}
+        symbols.append(
+            {
+                "symbol": entry.get("symbol", ""),
+                "base_asset": entry.get("baseAsset"),
+                "quote_asset": entry.get("quoteAsset"),
+                "status": entry.get("status"),
+                "tick_size": _filter_value(filters_by_type, "PRICE_FILTER", "tickSize"),
+                "lot_size": _filter_value(filters_by_type, "LOT_SIZE", "stepSize"),
+            }
+        )
+    return symbols
+
+
+def _parse_levels(levels: Iterable[List[str]]) -> List[Dict[str, float]]:
+    return [{"price": float(price), "size": float(size)} for price, size in levels]
+
+
+def _parse_order_book(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalise a Binance depth snapshot into the connector's order book shape."""
+
+    return {
+        "bids": _parse_levels(payload.get("bids", ())),
+        "asks": _parse_levels(payload.get("asks", ())),
+        "last_update_id": payload.get("lastUpdateId"),
+        "timestamp": datetime.now(timezone.utc),
+    }
+
+
+def _parse_klines(raw_bars: Iterable[List[Any]]) -> List[Dict[str, Any]]:
+    """Convert raw Binance klines into bar dictionaries.
+
+    Open/close times stay as Binance's epoch milliseconds; callers convert only where a
+    datetime is actually needed.
+    """
+
+    return [
+        {
+            "open_time": bar[0],
+            "open": float(bar[1]),
+            "high": float(bar[2]),
+            "low": float(bar[3]),
+            "close": float(bar[4]),
+            "volume": float(bar[5]),
+            "close_time": bar[6],
+            "quote_asset_volume": float(bar[7]),
+            "number_of_trades": int(bar[8]),
+        }
+        for bar in raw_bars
+    ]
+
+
 class BinanceMarketConnector(MarketConnector):
     """Adapter that exposes a coroutine-based interface over Binance's APIs."""
 
@@ -30,6 +100,8 @@ class BinanceMarketConnector(MarketConnector):
         request_interval_seconds: float = 60.0,
         reconnect_delay: float = 2.0,
         stream_url: str = "wss://stream.binance.com:9443/ws",
+        stream_buffer_size: int = 10_000,
+        symbols_cache_ttl: float = 300.0,
     ) -> None:
         self._rest_client = rest_client or Spot(api_key=api_key, api_secret=api_secret)
         if websocket_client_factory is None:
@@ -38,125 +110,119 @@ class BinanceMarketConnector(MarketConnector):
         self._rate_limiter = AsyncRateLimiter(request_rate, request_interval_seconds)
         self._reconnect_delay = reconnect_delay
         self._stream_url = stream_url
+        # Oldest trades are dropped if the consumer falls this far behind.
+        self._stream_buffer_size = stream_buffer_size
+        # Exchange info is several hundred KB and changes rarely: it is parsed once per TTL.
+        self._symbols_cache_ttl = symbols_cache_ttl
+        self._symbols_cache: tuple[float, List[Dict[str, Any]]] | None = None
+        self._symbols_lock = asyncio.Lock()
 
     async def list_symbols(
         self, *, search: str | None = None, limit: int | None = None
     ) -> List[Dict[str, Any]]:
         """Return the tradeable symbols available on Binance spot."""
 
-        await self._rate_limiter.acquire()
-        loop = asyncio.get_running_loop()
-        exchange_info = await loop.run_in_executor(None, self._rest_client.exchange_info)
-
-        symbols: list[dict[str, Any]] = []
-        for entry in exchange_info.get("symbols", []):
-            symbol = entry.get("symbol", "")
-            if search and search.lower() not in symbol.lower():
-                continue
-
-            tick_size: float | None = None
-            lot_size: float | None = None
-            for filt in entry.get("filters", []):
-                filter_type = filt.get("filterType")
-                if filter_type == "PRICE_FILTER":
-                    try:
-                        tick_size = float(filt.get("tickSize", 0))
-                    except (TypeError, ValueError):  # pragma: no cover - defensive
-                        tick_size = None
-                elif filter_type == "LOT_SIZE":
-                    try:
-                        lot_size = float(filt.get("stepSize", 0))
-                    except (TypeError, ValueError):  # pragma: no cover - defensive
-                        lot_size = None
-
-            symbols.append(
-                {
-                    "symbol": symbol,
-                    "base_asset": entry.get("baseAsset"),
-                    "quote_asset": entry.get("quoteAsset"),
-                    "status": entry.get("status"),
-                    "tick_size": tick_size,
-                    "lot_size": lot_size,
-                }
-            )
-
+        symbols = await self._load_symbols()
+        if search:
+            needle = search.lower()
+            symbols = [item for item in symbols if needle in item["symbol"].lower()]
         if limit is not None:
-            symbols = symbols[:limit]
-        return symbols
+            return symbols[:limit]
+        return list(symbols)
+
+    async def _load_symbols(self) -> List[Dict[str, Any]]:
+        """Return the parsed exchange info, refreshed at most once per ``symbols_cache_ttl``.
+
+        The cached dictionaries are shared between callers and must not be mutated.
+        """
+
+        cached = self._symbols_cache
+        if cached is not None and time.monotonic() - cached[0] < self._symbols_cache_ttl:
+            return cached[1]
+        async with self._symbols_lock:
+            # Concurrent callers queue on the lock and reuse the first caller's fetch.
+            cached = self._symbols_cache
+            if cached is not None and time.monotonic() - cached[0] < self._symbols_cache_ttl:
+                return cached[1]
+            await self._rate_limiter.acquire()
+            loop = asyncio.get_running_loop()
+            symbols = await loop.run_in_executor(
+                None, lambda: _parse_symbols(self._rest_client.exchange_info())
+            )
+            self._symbols_cache = (time.monotonic(), symbols)
+            return symbols
 
-    async def fetch_order_book(
-        self, symbol: str, *, depth: int = 50
-    ) -> Dict[str, Any]:
+    async def fetch_order_book(self, symbol: str, *, depth: int = 50) -> Dict[str, Any]:
         """Fetch the top levels of the Binance order book for a symbol."""
 
         await self._rate_limiter.acquire()
         loop = asyncio.get_running_loop()
-        payload = await loop.run_in_executor(
-            None, lambda: self._rest_client.depth(symbol=symbol, limit=min(depth, 500))
+        # Levels are converted in the executor thread alongside the REST call.
+        return await loop.run_in_executor(
+            None,
+            lambda: _parse_order_book(
+                self._rest_client.depth(symbol=symbol, limit=min(depth, 500))
+            ),
         )
 
-        bids = [
-            {"price": float(price), "size": float(size)}
-            for price, size in payload.get("bids", [])
-        ]
-        asks = [
-            {"price": float(price), "size": float(size)}
-            for price, size in payload.get("asks", [])
-        ]
-
-        return {
-            "bids": bids,
-            "asks": asks,
-            "last_update_id": payload.get("lastUpdateId"),
-            "timestamp": datetime.now(timezone.utc),
-        }
-
     async def fetch_ohlcv(
         self, symbol: str, interval: str, *, limit: int = 500
     ) -> Iterable[Dict[str, Any]]:
         await self._rate_limiter.acquire()
         loop = asyncio.get_running_loop()
-        raw_bars = await loop.run_in_executor(
-            None, lambda: self._rest_client.klines(symbol=symbol, interval=interval, limit=limit)
+        # Parsing runs in the executor next to the REST call so the event loop never
+        # spends time coercing hundreds of string fields.
+        return await loop.run_in_executor(
+            None,
+            lambda: _parse_klines(
+                self._rest_client.klines(symbol=symbol, interval=interval, limit=limit)
+            ),
         )
-        return [
-            {
-                "open_time": datetime.fromtimestamp(bar[0] / 1000, tz=timezone.utc),
-                "open": float(bar[1]),
-                "high": float(bar[2]),
-                "low": float(bar[3]),
-                "close": float(bar[4]),
-                "volume": float(bar[5]),
-                "close_time": datetime.fromtimestamp(bar[6] / 1000, tz=timezone.utc),
-                "quote_asset_volume": float(bar[7]),
-                "number_of_trades": int(bar[8]),
-            }
-            for bar in raw_bars
-        ]
+
+    async def _wait_for_traffic(self, have_data: asyncio.Event, buffer: deque[Any]) -> bool:
+        """Wait up to ``reconnect_delay`` for the websocket to deliver anything."""
+
+        # The event may still be set, or about to be, by pushes already drained: only a
+        # non-empty buffer counts as traffic. asyncio.timeout cancels the wait in place;
+        # wait_for would wrap it in a task.
+        try:
+            async with asyncio.timeout(self._reconnect_delay):
+                while not buffer:
+                    have_data.clear()
+                    await have_data.wait()
+        except TimeoutError:
+            return False
+        return True
 
     async def stream_trades(self, symbol: str) -> AsyncIterator[Dict[str, Any]]:
         stream_name = f"{symbol.lower()}@trade"
+        loop = asyncio.get_running_loop()
         while True:
-            queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+            # The websocket client invokes callbacks from its own thread: events are
+            # appended to a deque (thread-safe) and the loop is woken up once per batch.
+            buffer: deque[tuple[str, Any]] = deque(maxlen=self._stream_buffer_size)
+            have_data = asyncio.Event()
+
+            def _push(kind: str, payload: Any) -> None:
+                buffer.append((kind, payload))
+                loop.call_soon_threadsafe(have_data.set)
 
             def _handle_message(*args: Any) -> None:
                 message = args[-1] if args else {}
-                if isinstance(message, (bytes, bytearray)):
-                    payload: Any = json.loads(message.decode("utf-8"))
-                elif isinstance(message, str):
-                    payload = json.loads(message)
+                if isinstance(message, (bytes, bytearray, str)):
+                    payload: Any = orjson.loads(message)
                 else:
                     payload = message
-                queue.put_nowait(("data", payload))
+                _push("data", payload)
 
             def _handle_close(*_: Any) -> None:
-                queue.put_nowait(("error", ConnectionError("stream closed")))
+                _push("closed", ConnectionError("stream closed"))
 
             def _handle_error(*args: Any) -> None:
                 error = args[-1] if args else ConnectionError("unknown error")
                 if not isinstance(error, Exception):
                     error = ConnectionError(str(error))
-                queue.put_nowait(("error", error))
+                _push("error", error)
 
             ws_client = self._websocket_factory(
                 stream_url=self._stream_url,
@@ -164,17 +230,30 @@ class BinanceMarketConnector(MarketConnector):
                 on_close=_handle_close,
                 on_error=_handle_error,
             )
+            backoff = self._reconnect_delay
             try:
                 ws_client.subscribe(stream_name)
                 while True:
-                    kind, payload = await queue.get()
-                    if kind == "data":
-                        yield payload
-                    else:
-                        raise payload
+                    await have_data.wait()
+                    have_data.clear()
+                    while buffer:
+                        kind, payload = buffer.popleft()
+                        if kind == "data":
+                            yield payload
+                        elif kind == "error":
+                            # An error callback does not necessarily mean the socket is
+                            # gone: the backoff doubles as a grace period and the first
+                            # message to arrive resumes the stream on this connection.
+                            logger.warning("Binance trade stream error for %s: %s", symbol, payload)
+                            if not await self._wait_for_traffic(have_data, buffer):
+                                backoff = 0.0
+                                raise payload
+                        else:
+                            raise payload
             except Exception as exc:  # noqa: BLE001
-                logger.warning("Binance trade stream error for %s: %s", symbol, exc)
-                await asyncio.sleep(self._reconnect_delay)
+                logger.warning("Reconnecting Binance trade stream for %s: %s", symbol, exc)
+                if backoff:
+                    await asyncio.sleep(backoff)
             finally:
                 try:
                     ws_client.stop()
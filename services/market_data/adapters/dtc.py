@@ -3,14 +3,57 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import enum
+import functools
 import logging
+import operator
 import struct
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+# Precompiled layouts for the per-tick path: Struct.pack skips the format-string
+# cache lookup that struct.pack performs on every call.
+_HEADER_STRUCT = struct.Struct("<HH")
+_SYMBOL_ID_STRUCT = struct.Struct("<I")
+# A whole trade update frame: the per-symbol prefix (header + symbol id) followed by
+# price, size and epoch microseconds.
+_TRADE_FRAME_STRUCT = struct.Struct("<8sddQ")
+# Fixed-width string fields are NUL-padded by the ``s`` codes themselves.
+_SUBSCRIPTION_STRUCT = struct.Struct("<II64s32s")
+_LOGON_REQUEST_STRUCT = struct.Struct("<I32s32sH32s")
+
+
+def _encode_string(value: str, length: int) -> bytes:
+    """Encode ``value`` for a ``length``-byte field, keeping room for the NUL terminator."""
+
+    return value.encode("utf-8")[: length - 1] if length > 0 else b""
+
+
+# Reads every field a trade update needs from a tick object in one call.
+_TICK_ATTRS = operator.attrgetter("symbol", "price", "size", "timestamp")
+
+
+def _tick_fields(tick: Any) -> tuple[Any, Any, Any, Any]:
+    """Return ``(symbol, price, size, timestamp)`` from a mapping or an object."""
+
+    if not isinstance(tick, Mapping):
+        try:
+            return _TICK_ATTRS(tick)
+        except AttributeError:
+            tick = getattr(tick, "__dict__", {})
+    return tick.get("symbol"), tick.get("price"), tick.get("size"), tick.get("timestamp")
+
+
+# Symbols and exchanges form a small, stable working set re-encoded on every
+# (re)subscription. Credentials stay out of this process-wide cache.
+_encode_symbol_field = functools.lru_cache(maxsize=4096)(_encode_string)
+
 
 class DTCMessageType(enum.IntEnum):
     """Subset of message identifiers from the DTC specification."""
@@ -24,6 +67,12 @@ class DTCMessageType(enum.IntEnum):
     MARKET_DATA_UPDATE_TRADE = 103
 
 
+# Trade updates have a fixed size, so their header never changes.
+_TRADE_UPDATE_HEADER = _HEADER_STRUCT.pack(
+    _TRADE_FRAME_STRUCT.size, DTCMessageType.MARKET_DATA_UPDATE_TRADE
+)
+
+
 @dataclass(slots=True)
 class DTCConfig:
     host: str
@@ -40,34 +89,59 @@ class DTCConfig:
 class _SymbolSubscription:
     symbol_id: int
     active: bool = False
+    # Header and symbol id of this symbol's trade updates, fixed once the id is assigned.
+    prefix: bytes = b""
 
 
 class DTCAdapter:
     """Coroutine based client for the Sierra Chart DTC protocol."""
 
     _SEND_TIMEOUT = 2.0
+    _PUBLISH_CHUNK_TICKS = 256
 
     def __init__(self, config: DTCConfig) -> None:
         self._config = config
         self._connection_lock = asyncio.Lock()
-        self._io_lock = asyncio.Lock()
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._connected = False
         self._next_symbol_id = 1
         self._subscriptions: dict[str, _SymbolSubscription] = {}
+        # The logon request only depends on the configuration: encode it once for
+        # every connection and reconnection.
+        self._logon_payload = self._encode_logon_request()
+        # Packing buffers are reused across batches. They go back to this pool once a
+        # batch is sent, so concurrent publishers never share one.
+        self._chunk_buffers: list[bytearray] = []
 
     async def connect(self) -> None:
         await self._ensure_connection(force=True)
 
     async def publish_ticks(self, ticks: Iterable[Any]) -> None:
-        batch: list[Any] = list(ticks)
-        if not batch:
-            return
-        await self._ensure_connection()
-        for tick in batch:
-            payload = await self._encode_trade_update(tick)
-            await self._send_message(DTCMessageType.MARKET_DATA_UPDATE_TRADE, payload)
+        # Ticks are consumed lazily and packed in place into a pooled chunk buffer,
+        # flushed with a single write and drain every _PUBLISH_CHUNK_TICKS ticks.
+        # Subscriptions go out while encoding, so they precede the updates that need them.
+        # Each flush sends an immutable copy: the transport may hold on to it and a
+        # failed send is retried with the same bytes.
+        frame_size = _TRADE_FRAME_STRUCT.size
+        if self._chunk_buffers:
+            chunk = self._chunk_buffers.pop()
+        else:
+            chunk = bytearray(frame_size * self._PUBLISH_CHUNK_TICKS)
+        view = memoryview(chunk)
+        try:
+            offset = 0
+            for tick in ticks:
+                await self._pack_trade_update(tick, chunk, offset)
+                offset += frame_size
+                if offset == len(chunk):
+                    await self._send_frames(bytes(chunk))
+                    offset = 0
+            if offset:
+                await self._send_frames(bytes(view[:offset]))
+        finally:
+            view.release()
+            self._chunk_buffers.append(chunk)
 
     async def close(self) -> None:
         async with self._connection_lock:
@@ -88,52 +162,55 @@ class DTCAdapter:
                 subscription.active = False
 
     async def subscribe(self, symbol: str) -> int:
+        subscription = await self._subscribe(symbol)
+        return subscription.symbol_id
+
+    async def _subscribe(self, symbol: str) -> _SymbolSubscription:
         subscription = self._subscriptions.get(symbol)
         if subscription is None:
-            subscription = _SymbolSubscription(symbol_id=self._next_symbol_id)
+            symbol_id = self._next_symbol_id
+            subscription = _SymbolSubscription(
+                symbol_id=symbol_id,
+                prefix=_TRADE_UPDATE_HEADER + _SYMBOL_ID_STRUCT.pack(symbol_id),
+            )
             self._next_symbol_id += 1
             self._subscriptions[symbol] = subscription
         if subscription.active:
-            return subscription.symbol_id
+            return subscription
 
         payload = self._encode_subscription(symbol, subscription.symbol_id)
         await self._send_message(DTCMessageType.MARKET_DATA_SUBSCRIBE, payload)
         subscription.active = True
-        return subscription.symbol_id
+        return subscription
 
-    async def _encode_trade_update(self, tick: Any) -> bytes:
-        data: Mapping[str, Any]
-        if isinstance(tick, Mapping):
-            data = tick
-        else:
-            data = getattr(tick, "__dict__", {})
-        symbol = str(data.get("symbol", ""))
+    async def _pack_trade_update(self, tick: Any, buffer: bytearray, offset: int) -> None:
+        """Write the complete framed trade update for ``tick`` into ``buffer`` at ``offset``."""
+
+        symbol_value, price_value, size_value, timestamp = _tick_fields(tick)
+        symbol = str(symbol_value) if symbol_value is not None else ""
         if not symbol:
             raise ValueError("Tick payload must include a symbol")
-        price_value = data.get("price")
         price = float(price_value) if price_value is not None else 0.0
-        size_value = data.get("size")
         size = float(size_value) if size_value is not None else 0.0
-        timestamp = data.get("timestamp")
         if isinstance(timestamp, datetime):
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            timestamp = timestamp.astimezone(timezone.utc)
-            epoch = int(timestamp.timestamp() * 1_000_000)
+            # Exact integer arithmetic on the offset from the epoch; naive timestamps
+            # are UTC and aware ones need no astimezone before subtracting.
+            delta = timestamp - (_NAIVE_EPOCH if timestamp.tzinfo is None else _EPOCH)
+            epoch = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
         elif timestamp is None:
-            epoch = int(datetime.now(timezone.utc).timestamp() * 1_000_000)
+            epoch = time.time_ns() // 1_000
         else:
             epoch = int(timestamp)
 
-        symbol_id = await self.subscribe(symbol)
-        return struct.pack("<IddQ", symbol_id, price, size, epoch)
+        subscription = await self._subscribe(symbol)
+        _TRADE_FRAME_STRUCT.pack_into(buffer, offset, subscription.prefix, price, size, epoch)
 
     def _encode_subscription(self, symbol: str, symbol_id: int) -> bytes:
-        exchange = self._config.default_exchange
-        return (
-            struct.pack("<II", symbol_id, symbol_id)
-            + self._encode_string(symbol, 64)
-            + self._encode_string(exchange, 32)
+        return _SUBSCRIPTION_STRUCT.pack(
+            symbol_id,
+            symbol_id,
+            _encode_symbol_field(symbol, 64),
+            _encode_symbol_field(self._config.default_exchange, 32),
         )
 
     async def _ensure_connection(self, *, force: bool = False) -> None:
@@ -161,8 +238,9 @@ class DTCAdapter:
         await self._resubscribe()
 
     async def _perform_logon(self) -> None:
-        payload = self._encode_logon_request()
-        await self._send_message(DTCMessageType.LOGON_REQUEST, payload, ensure_connected=False)
+        await self._send_message(
+            DTCMessageType.LOGON_REQUEST, self._logon_payload, ensure_connected=False
+        )
         response_type, response_payload = await self._read_message()
         if response_type != DTCMessageType.LOGON_RESPONSE:
             raise ConnectionError(f"Unexpected DTC message {response_type} during logon")
@@ -173,9 +251,17 @@ class DTCAdapter:
     async def _resubscribe(self) -> None:
         if not self._subscriptions:
             return
-        for symbol, subscription in self._subscriptions.items():
-            payload = self._encode_subscription(symbol, subscription.symbol_id)
-            await self._send_message(DTCMessageType.MARKET_DATA_SUBSCRIBE, payload, retry=False)
+        # Every subscription is pipelined into one write, so restoring N symbols after a
+        # reconnect costs a single drain instead of N.
+        frames = b"".join(
+            self._frame_message(
+                DTCMessageType.MARKET_DATA_SUBSCRIBE,
+                self._encode_subscription(symbol, subscription.symbol_id),
+            )
+            for symbol, subscription in self._subscriptions.items()
+        )
+        await self._send_frames(frames, retry=False)
+        for subscription in self._subscriptions.values():
             subscription.active = True
 
     async def _send_message(
@@ -186,35 +272,45 @@ class DTCAdapter:
         ensure_connected: bool = True,
         retry: bool = True,
     ) -> None:
+        await self._send_frames(
+            self._frame_message(message_type, payload),
+            ensure_connected=ensure_connected,
+            retry=retry,
+        )
+
+    async def _send_frames(
+        self,
+        frames: bytes,
+        *,
+        ensure_connected: bool = True,
+        retry: bool = True,
+    ) -> None:
+        """Write one or more framed messages and drain once; retried as a whole."""
+
         if ensure_connected:
             await self._ensure_connection()
         writer = self._writer
         if writer is None:
             raise ConnectionError("DTC connection is not available")
-        message = self._frame_message(message_type, payload)
         caught_exc: Exception | None = None
-        async with self._io_lock:
-            try:
-                writer.write(message)
-                await asyncio.wait_for(writer.drain(), timeout=self._SEND_TIMEOUT)
-            except (
-                ConnectionError,
-                asyncio.IncompleteReadError,
-                BrokenPipeError,
-                asyncio.TimeoutError,
-            ) as exc:
-                logger.warning("DTC send failed: %s", exc)
-                caught_exc = exc
+        # write() is synchronous, so frames from concurrent senders never interleave;
+        # no lock is held while draining, letting several senders wait on one drain.
+        try:
+            writer.write(frames)
+            await asyncio.wait_for(writer.drain(), timeout=self._SEND_TIMEOUT)
+        except (
+            ConnectionError,
+            asyncio.IncompleteReadError,
+            BrokenPipeError,
+            asyncio.TimeoutError,
+        ) as exc:
+            logger.warning("DTC send failed: %s", exc)
+            caught_exc = exc
         if caught_exc is not None:
             await self._handle_disconnect()
             if retry:
                 await self._ensure_connection(force=True)
-                await self._send_message(
-                    message_type,
-                    payload,
-                    ensure_connected=False,
-                    retry=False,
-                )
+                await self._send_frames(frames, ensure_connected=False, retry=False)
             else:
                 raise caught_exc
 
@@ -233,31 +329,26 @@ class DTCAdapter:
         reader = self._reader
         if reader is None:
             raise ConnectionError("DTC connection is not available")
-        header = await reader.readexactly(4)
-        size, message_type = struct.unpack("<HH", header)
+        header = await reader.readexactly(_HEADER_STRUCT.size)
+        size, message_type = _HEADER_STRUCT.unpack(header)
         if size < 4:
             raise ConnectionError("Invalid DTC message size")
         payload = await reader.readexactly(size - 4)
         return DTCMessageType(message_type), payload
 
     def _encode_logon_request(self) -> bytes:
-        return (
-            struct.pack("<I", self._config.protocol_version)
-            + self._encode_string(self._config.client_user_id, 32)
-            + self._encode_string(self._config.client_password, 32)
-            + struct.pack("<H", self._config.heartbeat_interval)
-            + self._encode_string(self._config.client_name, 32)
+        return _LOGON_REQUEST_STRUCT.pack(
+            self._config.protocol_version,
+            _encode_string(self._config.client_user_id, 32),
+            _encode_string(self._config.client_password, 32),
+            self._config.heartbeat_interval,
+            _encode_string(self._config.client_name, 32),
         )
 
-    @staticmethod
-    def _encode_string(value: str, length: int) -> bytes:
-        data = value.encode("utf-8")[: length - 1] if length > 0 else b""
-        return data + b"\x00" * (length - len(data))
-
     @staticmethod
     def _frame_message(message_type: DTCMessageType, payload: bytes) -> bytes:
-        size = 4 + len(payload)
-        return struct.pack("<HH", size, int(message_type)) + payload
+        size = _HEADER_STRUCT.size + len(payload)
+        return _HEADER_STRUCT.pack(size, int(message_type)) + payload
 
     @staticmethod
     def _decode_logon_response(payload: bytes) -> tuple[int, str]:
@@ -13,6 +13,26 @@ from .rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+_EPOCH = datetime.fromtimestamp(0, tz=_UTC)
+_BAR_TIME_FORMAT = "%Y%m%d %H:%M:%S"
+
+
+def _bar_timestamp(bar_time: Any) -> datetime:
+    """Normalise an IBKR bar date to an aware UTC datetime, the epoch when unknown."""
+
+    # ib_async already parses bar dates, so the datetime case is checked first.
+    if isinstance(bar_time, datetime):
+        return bar_time if bar_time.tzinfo else bar_time.replace(tzinfo=_UTC)
+    if isinstance(bar_time, (int, float)):
+        return datetime.fromtimestamp(float(bar_time), tz=_UTC)
+    if isinstance(bar_time, str):
+        try:
+            return datetime.strptime(bar_time, _BAR_TIME_FORMAT).replace(tzinfo=_UTC)
+        except ValueError:
+            return _EPOCH
+    return _EPOCH
+
 
 class IBKRMarketConnector(MarketConnector):
     """Adapter that wraps the asynchronous interface exposed by ``ib_async``."""
@@ -67,37 +87,19 @@ class IBKRMarketConnector(MarketConnector):
             useRTH=use_rth,
             formatDate=format_date,
         )
-        normalized: list[dict[str, Any]] = []
-        for bar in bars:
-            bar_time = getattr(bar, "date", None)
-            if isinstance(bar_time, (int, float)):
-                timestamp = datetime.fromtimestamp(float(bar_time), tz=timezone.utc)
-            elif isinstance(bar_time, str):
-                try:
-                    timestamp = datetime.strptime(bar_time, "%Y%m%d %H:%M:%S").replace(
-                        tzinfo=timezone.utc
-                    )
-                except ValueError:
-                    timestamp = datetime.fromtimestamp(0, tz=timezone.utc)
-            elif isinstance(bar_time, datetime):
-                timestamp = bar_time if bar_time.tzinfo else bar_time.replace(tzinfo=timezone.utc)
-            else:
-                timestamp = datetime.fromtimestamp(0, tz=timezone.utc)
-
-            normalized.append(
-                {
-                    "timestamp": timestamp,
-                    "open": float(getattr(bar, "open", 0.0)),
-                    "high": float(getattr(bar, "high", 0.0)),
-                    "low": float(getattr(bar, "low", 0.0)),
-                    "close": float(getattr(bar, "close", 0.0)),
-                    "volume": float(getattr(bar, "volume", 0.0)),
-                    "bar_count": int(getattr(bar, "barCount", 0)),
-                    "average": float(getattr(bar, "average", 0.0)),
-                }
-            )
-
-        return normalized
+        return [
+            {
+                "timestamp": _bar_timestamp(getattr(bar, "date", None)),
+                "open": float(getattr(bar, "open", 0.0)),
+                "high": float(getattr(bar, "high", 0.0)),
+                "low": float(getattr(bar, "low", 0.0)),
+                "close": float(getattr(bar, "close", 0.0)),
+                "volume": float(getattr(bar, "volume", 0.0)),
+                "bar_count": int(getattr(bar, "barCount", 0)),
+                "average": float(getattr(bar, "average", 0.0)),
+            }
+            for bar in bars
+        ]
 
     async def stream_trades(self, contract: Any) -> AsyncIterator[Any]:
         while True:
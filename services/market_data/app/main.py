@@ -4,7 +4,7 @@ import asyncio
 import hmac
 import json
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
 
@@ -58,15 +58,20 @@ app.add_middleware(RequestContextMiddleware, service_name="market-data")
 setup_metrics(app, service_name="market-data")
 
 
+_binance_adapter: BinanceMarketConnector | None = None
 _dtc_adapter: DTCAdapter | None = None
 _dtc_adapter_lock = asyncio.Lock()
 
 
 def get_binance_adapter(settings: Settings = Depends(get_settings)) -> BinanceMarketConnector:
-    return BinanceMarketConnector(
-        api_key=settings.binance_api_key,
-        api_secret=settings.binance_api_secret,
-    )
+    # One connector per process so its rate limiter and symbol cache span requests.
+    global _binance_adapter
+    if _binance_adapter is None:
+        _binance_adapter = BinanceMarketConnector(
+            api_key=settings.binance_api_key,
+            api_secret=settings.binance_api_secret,
+        )
+    return _binance_adapter
 
 
 def get_ibkr_adapter(settings: Settings = Depends(get_settings)) -> IBKRMarketConnector:
@@ -178,20 +183,10 @@ def _persist_tick_record(tick: PersistedTick) -> None:
 
 
 async def publish_ticks_to_dtc(dtc: DTCAdapter, ticks: Iterable[PersistedTick]) -> None:
-    payload = [
-        {
-            "exchange": tick.exchange,
-            "symbol": tick.symbol,
-            "source": tick.source,
-            "timestamp": tick.timestamp,
-            "price": tick.price,
-            "size": tick.size,
-            "side": tick.side,
-        }
-        for tick in ticks
-    ]
-    if payload:
-        await dtc.publish_ticks(payload)
+    # The adapter reads tick attributes directly; no per-tick dict is built.
+    batch = list(ticks)
+    if batch:
+        await dtc.publish_ticks(batch)
 
 
 @app.post("/webhooks/tradingview", status_code=202)
@@ -381,6 +376,15 @@ async def get_quote(
     )
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _from_epoch_ms(value: int) -> datetime:
+    """Convert Binance epoch milliseconds (cheaper than ``datetime.fromtimestamp``)."""
+
+    return _EPOCH + timedelta(milliseconds=value)
+
+
 @app.get(
     "/market-data/history/{symbol}",
     response_model=HistoryResponse,
@@ -427,8 +431,10 @@ async def get_history(
 
         open_time = data.get("open_time") or data.get("timestamp")
         close_time = data.get("close_time") or data.get("timestamp")
-        data.setdefault("open_time", open_time)
-        data.setdefault("close_time", close_time)
+        data["open_time"] = _from_epoch_ms(open_time) if isinstance(open_time, int) else open_time
+        data["close_time"] = (
+            _from_epoch_ms(close_time) if isinstance(close_time, int) else close_time
+        )
         if "trades" not in data:
             trades = data.get("number_of_trades") or data.get("bar_count")
             if trades is not None:
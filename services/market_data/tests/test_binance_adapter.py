@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 from collections.abc import AsyncIterator
 from typing import Any, Callable
 
@@ -73,7 +74,7 @@ class FakeWebsocketClient:
             self._on_message(payload)
             self._on_error(ConnectionError("boom"))
         else:
-            payload = json.dumps({"s": "BTCUSDT", "p": "42001"})
+            payload = json.dumps({"s": "BTCUSDT", "p": "42001"}).encode("utf-8")
             self._on_message(payload)
             self._on_close()
 
@@ -152,6 +153,31 @@ def test_binance_list_symbols_filters() -> None:
     asyncio.run(run())
 
 
+def test_binance_list_symbols_reuses_cached_exchange_info() -> None:
+    fake = FakeSpotClient()
+    adapter = BinanceMarketConnector(rest_client=fake)
+
+    async def run() -> None:
+        results = await asyncio.gather(*(adapter.list_symbols() for _ in range(3)))
+        filtered = await adapter.list_symbols(search="eth")
+
+        assert all(len(symbols) == 2 for symbols in results)
+        assert [item["symbol"] for item in filtered] == ["ETHUSDT"]
+        assert filtered[0]["tick_size"] is None
+
+    asyncio.run(run())
+    assert fake.calls == [{"method": "exchange_info"}]
+
+    expired = BinanceMarketConnector(rest_client=fake, symbols_cache_ttl=0.0)
+
+    async def refresh() -> None:
+        await expired.list_symbols()
+        await expired.list_symbols()
+
+    asyncio.run(refresh())
+    assert len(fake.calls) == 3
+
+
 def test_binance_order_book_normalised() -> None:
     fake = FakeSpotClient()
     adapter: BinanceMarketConnector = BinanceMarketConnector(rest_client=fake)
@@ -162,3 +188,131 @@ def test_binance_order_book_normalised() -> None:
         assert book["asks"][0]["size"] == 1.0
 
     asyncio.run(run())
+
+
+def test_binance_stream_receives_messages_from_websocket_thread() -> None:
+    class ThreadedWebsocketClient:
+        def __init__(self, *, on_message: Callable[..., None], **_: Any) -> None:
+            self._on_message = on_message
+            self._thread: threading.Thread | None = None
+
+        def subscribe(self, stream: str) -> None:
+            def _emit() -> None:
+                for price in ("1", "2", "3"):
+                    self._on_message(None, json.dumps({"s": "BTCUSDT", "p": price}).encode())
+
+            self._thread = threading.Thread(target=_emit)
+            self._thread.start()
+
+        def stop(self) -> None:
+            if self._thread is not None:
+                self._thread.join()
+
+    adapter = BinanceMarketConnector(
+        rest_client=FakeSpotClient(),
+        websocket_client_factory=lambda **kwargs: ThreadedWebsocketClient(**kwargs),
+    )
+
+    async def run() -> list[str]:
+        prices: list[str] = []
+        stream = adapter.stream_trades("BTCUSDT")
+        async for message in stream:
+            prices.append(message["p"])
+            if len(prices) == 3:
+                break
+        await stream.aclose()
+        return prices
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=2.0)) == ["1", "2", "3"]
+
+
+def test_binance_stream_resumes_after_transient_error_without_reconnecting() -> None:
+    clients: list[Any] = []
+
+    class FlakyWebsocketClient:
+        def __init__(
+            self, *, on_message: Callable[..., None], on_error: Callable[..., None], **_: Any
+        ) -> None:
+            self._on_message = on_message
+            self._on_error = on_error
+            self._timer: threading.Timer | None = None
+
+        def subscribe(self, stream: str) -> None:
+            self._on_message(json.dumps({"s": "BTCUSDT", "p": "1"}))
+            self._on_error(ConnectionError("ping timeout"))
+            self._timer = threading.Timer(
+                0.05, self._on_message, args=(json.dumps({"s": "BTCUSDT", "p": "2"}),)
+            )
+            self._timer.start()
+
+        def stop(self) -> None:
+            if self._timer is not None:
+                self._timer.cancel()
+
+    def factory(**kwargs: Any) -> FlakyWebsocketClient:
+        client = FlakyWebsocketClient(**kwargs)
+        clients.append(client)
+        return client
+
+    adapter = BinanceMarketConnector(
+        rest_client=FakeSpotClient(),
+        websocket_client_factory=factory,
+        reconnect_delay=5.0,
+    )
+
+    async def run() -> list[str]:
+        prices: list[str] = []
+        stream = adapter.stream_trades("BTCUSDT")
+        async for message in stream:
+            prices.append(message["p"])
+            if len(prices) == 2:
+                break
+        await stream.aclose()
+        return prices
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=2.0)) == ["1", "2"]
+    assert len(clients) == 1
+
+
+def test_binance_stream_reconnects_after_error_raised_while_consumer_is_paused() -> None:
+    clients: list[Any] = []
+
+    class SilentAfterErrorClient:
+        def __init__(
+            self, *, on_message: Callable[..., None], on_error: Callable[..., None], **_: Any
+        ) -> None:
+            self.on_message = on_message
+            self.on_error = on_error
+
+        def subscribe(self, stream: str) -> None:
+            self.on_message(json.dumps({"s": "BTCUSDT", "p": str(len(clients))}))
+
+        def stop(self) -> None:
+            return None
+
+    def factory(**kwargs: Any) -> SilentAfterErrorClient:
+        client = SilentAfterErrorClient(**kwargs)
+        clients.append(client)
+        return client
+
+    adapter = BinanceMarketConnector(
+        rest_client=FakeSpotClient(),
+        websocket_client_factory=factory,
+        reconnect_delay=0.05,
+    )
+
+    async def run() -> list[str]:
+        prices: list[str] = []
+        stream = adapter.stream_trades("BTCUSDT")
+        async for message in stream:
+            prices.append(message["p"])
+            if len(prices) == 2:
+                break
+            # The error lands while the generator is suspended at its yield, after the
+            # data push has already set the wake-up event; then the socket goes silent.
+            clients[-1].on_error(ConnectionError("ping timeout"))
+        await stream.aclose()
+        return prices
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=2.0)) == ["1", "2"]
+    assert len(clients) == 2
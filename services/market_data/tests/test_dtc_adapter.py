@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import struct
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
@@ -230,3 +231,173 @@ def test_dtc_adapter_reconnects_after_disconnect() -> None:
         assert server.updates[-1]["price"] == 18001.0
 
     asyncio.run(run())
+
+
+def test_dtc_adapter_writes_tick_batch_in_one_frame_buffer() -> None:
+    async def run() -> None:
+        server = MockDTCServer()
+        await server.start()
+        assert server.port is not None
+
+        adapter = DTCAdapter(DTCConfig(host="127.0.0.1", port=server.port))
+        await adapter.connect()
+        await adapter.subscribe("ESZ4")
+        await adapter.subscribe("NQZ4")
+
+        writes: list[bytes] = []
+        writer = adapter._writer
+        assert writer is not None
+        original_write = writer.write
+
+        def recording_write(data: bytes) -> None:
+            writes.append(data)
+            original_write(data)
+
+        writer.write = recording_write  # type: ignore[method-assign]
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        await adapter.publish_ticks(
+            [
+                {"symbol": symbol, "price": price, "size": 1.0, "timestamp": timestamp}
+                for symbol, price in (("ESZ4", 1.0), ("NQZ4", 2.0), ("ESZ4", 3.0))
+            ]
+        )
+        batch_writes = list(writes)
+        await asyncio.sleep(0.05)
+        await adapter.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+
+        assert len(batch_writes) == 1
+        assert [update["price"] for update in server.updates] == [1.0, 2.0, 3.0]
+        assert [update["symbol_id"] for update in server.updates] == [1, 2, 1]
+
+    asyncio.run(run())
+
+
+def test_dtc_adapter_streams_tick_generators_in_chunks() -> None:
+    async def run() -> None:
+        server = MockDTCServer()
+        await server.start()
+        assert server.port is not None
+
+        adapter = DTCAdapter(DTCConfig(host="127.0.0.1", port=server.port))
+        adapter._PUBLISH_CHUNK_TICKS = 2
+        sent: list[bytes] = []
+        send_frames = adapter._send_frames
+
+        async def recording_send(frames: bytes, **kwargs: Any) -> None:
+            if struct.unpack_from("<HH", frames)[1] == DTCMessageType.MARKET_DATA_UPDATE_TRADE:
+                sent.append(frames)
+            await send_frames(frames, **kwargs)
+
+        adapter._send_frames = recording_send  # type: ignore[method-assign]
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        await adapter.publish_ticks(
+            {"symbol": "ESZ4", "price": float(index), "size": 1.0, "timestamp": timestamp}
+            for index in range(5)
+        )
+        await asyncio.sleep(0.05)
+        await adapter.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+
+        assert [len(frames) // 32 for frames in sent] == [2, 2, 1]
+        assert [update["price"] for update in server.updates] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    asyncio.run(run())
+
+
+def test_dtc_adapter_resubscribes_in_one_write_after_reconnect() -> None:
+    async def run() -> None:
+        server = MockDTCServer()
+        await server.start()
+        assert server.port is not None
+
+        adapter = DTCAdapter(DTCConfig(host="127.0.0.1", port=server.port))
+        for symbol in ("ESZ4", "NQZ4", "YMZ4"):
+            await adapter.subscribe(symbol)
+        sent: list[bytes] = []
+        send_frames = adapter._send_frames
+
+        async def recording_send(frames: bytes, **kwargs: Any) -> None:
+            sent.append(frames)
+            await send_frames(frames, **kwargs)
+
+        adapter._send_frames = recording_send  # type: ignore[method-assign]
+        await adapter.connect()
+        await asyncio.sleep(0.05)
+        await adapter.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+
+        subscribe_writes = [
+            frames
+            for frames in sent
+            if struct.unpack_from("<HH", frames)[1] == DTCMessageType.MARKET_DATA_SUBSCRIBE
+        ]
+        assert len(subscribe_writes) == 1
+        assert [item["symbol"] for item in server.subscriptions[-3:]] == ["ESZ4", "NQZ4", "YMZ4"]
+        assert [item["symbol_id"] for item in server.subscriptions[-3:]] == [1, 2, 3]
+
+    asyncio.run(run())
+
+
+@dataclass(slots=True)
+class _SlottedTick:
+    symbol: str
+    price: float
+    size: float
+    timestamp: datetime
+
+
+class _PartialTick:
+    def __init__(self, symbol: str, price: float) -> None:
+        self.symbol = symbol
+        self.price = price
+
+
+def test_dtc_adapter_publishes_tick_objects() -> None:
+    async def run() -> None:
+        server = MockDTCServer()
+        await server.start()
+        assert server.port is not None
+
+        adapter = DTCAdapter(DTCConfig(host="127.0.0.1", port=server.port))
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        await adapter.publish_ticks(
+            [_SlottedTick("ESZ4", 4200.25, 2.0, timestamp), _PartialTick("ESZ4", 4200.5)]
+        )
+        await asyncio.sleep(0.05)
+        await adapter.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+
+        assert [update["price"] for update in server.updates] == [4200.25, 4200.5]
+        assert [update["size"] for update in server.updates] == [2.0, 0.0]
+        assert server.updates[0]["epoch"] == 1_704_067_200_000_000
+
+    asyncio.run(run())
+
+
+def test_dtc_adapter_reuses_chunk_buffer_between_batches() -> None:
+    async def run() -> None:
+        server = MockDTCServer()
+        await server.start()
+        assert server.port is not None
+
+        adapter = DTCAdapter(DTCConfig(host="127.0.0.1", port=server.port))
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        tick = {"symbol": "ESZ4", "price": 1.0, "size": 1.0, "timestamp": timestamp}
+        await adapter.publish_ticks([tick])
+        (buffer,) = adapter._chunk_buffers
+        await adapter.publish_ticks([{**tick, "price": 2.0}])
+        await asyncio.sleep(0.05)
+        await adapter.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+
+        assert len(adapter._chunk_buffers) == 1
+        assert adapter._chunk_buffers[0] is buffer
+        assert [update["price"] for update in server.updates] == [1.0, 2.0]
+
+    asyncio.run(run())
@@ -52,11 +52,10 @@ class BinanceConnectorFake(_BaseConnector):
 
     async def fetch_ohlcv(self, symbol: str, interval: str, *, limit: int = 500) -> list[dict[str, Any]]:
         self._record("fetch_ohlcv", symbol, interval, limit)
-        now = datetime.now(timezone.utc)
         return [
             {
-                "open_time": now,
-                "close_time": now,
+                "open_time": 1_704_067_200_000,
+                "close_time": 1_704_067_259_999,
                 "open": 99.0,
                 "high": 105.0,
                 "low": 95.0,
@@ -162,7 +161,10 @@ def test_history_endpoint_handles_ibkr_and_binance() -> None:
         app.dependency_overrides.clear()
 
     assert binance_response.status_code == 200
-    assert binance_response.json()["candles"][0]["open"] == 99.0
+    binance_candle = binance_response.json()["candles"][0]
+    assert binance_candle["open"] == 99.0
+    assert binance_candle["open_time"] == "2024-01-01T00:00:00+00:00"
+    assert binance_candle["close_time"] == "2024-01-01T00:00:59.999000+00:00"
 
     assert ibkr_response.status_code == 200
     assert ibkr_response.json()["candles"][0]["open"] == 10.0